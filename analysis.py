@@ -70,7 +70,9 @@ def apply_swing(notes_data, swing_ratio=0.6, beat_duration=0.5):
     Apply swing feel to notes by delaying off-beat notes.
     
     This is a pure function that creates a new list with modified timing for off-beat notes.
-    It implements the swing transformation that's critical for the JUCE plugin's real-time
+    Off-beat notes are copied before being delayed; all other notes are shared with the
+    input list, so treat the returned note dictionaries as read-only (as with
+    filter_notes_by_pitch). It implements the swing transformation that's critical for the JUCE plugin's real-time
     MIDI processing, but in a pure Python form for analysis and testing.
     
     Args:
@@ -104,6 +106,10 @@ def apply_swing(notes_data, swing_ratio=0.6, beat_duration=0.5):
     if beat_duration <= 0:
         raise ValueError("beat_duration must be positive")
     
+    # Calculate swing delay once; it is the same for every off-beat note
+    # swing_ratio 0.5 = no delay, 0.6 = slight delay, 0.7 = more delay
+    swing_delay = (swing_ratio - 0.5) * beat_duration * 0.25  # Max delay is 25% of beat
+    
     # Pure function: create new list, don't modify original
     swung_notes = []
     
@@ -118,9 +124,6 @@ def apply_swing(notes_data, swing_ratio=0.6, beat_duration=0.5):
         if not isinstance(note['start_time_seconds'], (int, float)):
             continue  # Skip notes with invalid timing type
         
-        # Create a copy of the note to avoid modifying the original
-        new_note = note.copy()
-        
         # Calculate position within the beat
         start_time = note['start_time_seconds']
         beat_position = start_time % beat_duration
@@ -130,13 +133,10 @@ def apply_swing(notes_data, swing_ratio=0.6, beat_duration=0.5):
         is_off_beat = 0.4 <= beat_fraction <= 0.6
         
         if is_off_beat:
-            # Calculate swing delay
-            # swing_ratio 0.5 = no delay, 0.6 = slight delay, 0.7 = more delay
-            swing_delay = (swing_ratio - 0.5) * beat_duration * 0.25  # Max delay is 25% of beat
-            
-            # Apply the delay
-            new_note['start_time_seconds'] = start_time + swing_delay
-        
-        swung_notes.append(new_note)
+            # Apply the delay to a copy so the original note is untouched
+            swung_notes.append({**note, 'start_time_seconds': start_time + swing_delay})
+        else:
+            # Unchanged notes are shared rather than copied
+            swung_notes.append(note)
     
     return swung_notes
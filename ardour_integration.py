@@ -10,11 +10,12 @@ This module provides file-based integration with Ardour DAW using:
 
 import os
 import json
+import shutil
 import subprocess
 import tempfile
 from pathlib import Path
 from typing import List, Dict, Any, Optional, Tuple
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 import xml.etree.ElementTree as ET
 
 
@@ -52,6 +53,18 @@ class ArdourProject:
     regions: List[ArdourRegion]
 
 
+@dataclass
+class RegionImprovementResult:
+    """Result of improving a selected Ardour region."""
+    success: bool
+    improvement_type: str = ""
+    explanation: str = ""
+    changes_made: List[str] = field(default_factory=list)
+    confidence: float = 0.0
+    improved_file: Optional[str] = None
+    error: str = ""
+
+
 class ArdourIntegration:
     """File-based integration with Ardour DAW."""
     
@@ -67,6 +80,7 @@ class ArdourIntegration:
         self.connected = False
         self.current_project = None
         self.temp_dir = tempfile.mkdtemp(prefix="yesand_ardour_")
+        self._solvers: Dict[str, Any] = {}  # improvement type -> solver, created on first use
         
     def _find_ardour_executable(self) -> Optional[str]:
         """Find Ardour executable on the system."""
@@ -85,13 +99,12 @@ class ArdourIntegration:
         return None
     
     def _command_exists(self, command: str) -> bool:
-        """Check if a command exists in PATH."""
-        try:
-            subprocess.run([command, "--version"], 
-                         capture_output=True, check=True, timeout=5)
-            return True
-        except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired):
-            return False
+        """Check if a command exists in PATH.
+        
+        Resolved in-process with shutil.which rather than spawning
+        ``command --version``, which launched the executable just to probe it.
+        """
+        return shutil.which(command) is not None
     
     def connect(self) -> bool:
         """Connect to Ardour (check if it's running and accessible).
@@ -375,54 +388,77 @@ class ArdourIntegration:
         except Exception as e:
             return {"error": f"Analysis failed: {str(e)}"}
     
-    def improve_selected_region(self, improvement_type: str = "groove") -> Dict[str, Any]:
+    def improve_selected_region(self, improvement_type: str = "groove") -> RegionImprovementResult:
         """Improve selected region in Ardour.
         
         Args:
             improvement_type: Type of improvement ("groove", "harmony", "arrangement")
             
         Returns:
-            Improvement results dictionary
+            RegionImprovementResult describing the improvement or the error
         """
         if not self.connected:
-            return {"error": "Not connected to Ardour"}
+            return RegionImprovementResult(success=False, error="Not connected to Ardour")
         
         # Export the selected region first
         exported_file = self.export_selected_region()
         if not exported_file:
-            return {"error": "Failed to export selected region"}
+            return RegionImprovementResult(success=False, error="Failed to export selected region")
         
         try:
-            from musical_solvers import GrooveImprover, HarmonyFixer, ArrangementImprover
+            solver = self._get_solver(improvement_type)
             
             if improvement_type == "groove":
-                solver = GrooveImprover()
                 result = solver.improve_groove(exported_file)
             elif improvement_type == "harmony":
-                solver = HarmonyFixer()
                 result = solver.fix_harmony(exported_file)
             elif improvement_type == "arrangement":
-                solver = ArrangementImprover()
                 result = solver.improve_arrangement(exported_file)
             else:
-                return {"error": f"Unknown improvement type: {improvement_type}"}
+                return RegionImprovementResult(
+                    success=False, error=f"Unknown improvement type: {improvement_type}"
+                )
             
             # Import the improved version back to Ardour
             if result.audio_preview_path and os.path.exists(result.audio_preview_path):
                 improved_name = f"Improved_{improvement_type}_{os.path.basename(exported_file)}"
                 self.import_midi_file(result.audio_preview_path, improved_name)
             
-            return {
-                "success": True,
-                "improvement_type": improvement_type,
-                "explanation": result.explanation,
-                "changes_made": result.changes_made,
-                "confidence": result.confidence,
-                "improved_file": result.audio_preview_path
-            }
+            return RegionImprovementResult(
+                success=True,
+                improvement_type=improvement_type,
+                explanation=result.explanation,
+                changes_made=result.changes_made,
+                confidence=result.confidence,
+                improved_file=result.audio_preview_path
+            )
             
         except Exception as e:
-            return {"error": f"Improvement failed: {str(e)}"}
+            return RegionImprovementResult(success=False, error=f"Improvement failed: {str(e)}")
+    
+    def _get_solver(self, improvement_type: str) -> Optional[Any]:
+        """Get the solver for an improvement type, reusing it across calls.
+        
+        Args:
+            improvement_type: Type of improvement ("groove", "harmony", "arrangement")
+            
+        Returns:
+            The solver instance, or None for an unknown improvement type
+        """
+        if improvement_type not in self._solvers:
+            from musical_solvers import GrooveImprover, HarmonyFixer, ArrangementImprover
+            
+            solver_classes = {
+                "groove": GrooveImprover,
+                "harmony": HarmonyFixer,
+                "arrangement": ArrangementImprover
+            }
+            solver_class = solver_classes.get(improvement_type)
+            if solver_class is None:
+                return None
+            self._solvers[improvement_type] = solver_class()
+        
+        return self._solvers[improvement_type]
     
     def create_lua_script(self, script_type: str, output_path: str = None) -> Optional[str]:
         """Create Lua script for Ardour automation.
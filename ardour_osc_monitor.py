@@ -215,38 +215,37 @@ class ArdourOSCMonitor:
     
     def _request_initial_state(self):
         """Request initial project state from Ardour."""
-        try:
-            # Request project information
-            self._send_osc_message("/ardour/request/tempo")
-            self._send_osc_message("/ardour/request/time_signature")
-            self._send_osc_message("/ardour/request/sample_rate")
-            
-            # Request track information
-            self._send_osc_message("/ardour/request/tracks")
-            
-            # Request region information
-            self._send_osc_message("/ardour/request/regions")
-            
-            # Request selection information
-            self._send_osc_message("/ardour/request/selection")
-            
-        except Exception as e:
-            self.logger.error(f"Error requesting initial state: {e}")
+        self._send_osc_bundle([
+            # Project information
+            "/ardour/request/tempo",
+            "/ardour/request/time_signature",
+            "/ardour/request/sample_rate",
+            # Track, region and selection information
+            "/ardour/request/tracks",
+            "/ardour/request/regions",
+            "/ardour/request/selection",
+        ])
     
     def _request_state_update(self):
         """Request state update from Ardour."""
+        # Request updated tracks, regions and selection in one packet
+        self._send_osc_bundle([
+            "/ardour/request/tracks",
+            "/ardour/request/regions",
+            "/ardour/request/selection",
+        ])
+    
+    def _send_osc_bundle(self, addresses: List[str]):
+        """Send several argument-less OSC requests to Ardour as one bundle."""
         try:
-            # Request updated track information
-            self._send_osc_message("/ardour/request/tracks")
-            
-            # Request updated region information
-            self._send_osc_message("/ardour/request/regions")
+            bundle = osc_bundle_builder.OscBundleBuilder(osc_bundle_builder.IMMEDIATELY)
+            for address in addresses:
+                bundle.add_content(osc_message_builder.OscMessageBuilder(address).build())
             
-            # Request updated selection
-            self._send_osc_message("/ardour/request/selection")
+            self.osc_client.sendto(bundle.build().dgram, (self.ardour_host, self.ardour_port))
             
         except Exception as e:
-            self.logger.error(f"Error requesting state update: {e}")
+            self.logger.error(f"Error sending OSC bundle {addresses}: {e}")
     
     def _send_osc_message(self, address: str, *args):
         """Send OSC message to Ardour."""
@@ -9,7 +9,7 @@ from __future__ import annotations
 
 import threading
 import time
-from typing import Optional
+from typing import Callable, Dict, Optional
 
 from .parser import CommandParser
 from .pattern_engine import PatternEngine
@@ -19,7 +19,6 @@ from midi_player import MidiPlayer
 from sequencer import Sequencer
 from osc_sender import OSCSender
 from contextual_intelligence import ContextualIntelligence
-from musical_solvers import GrooveImprover, HarmonyFixer, ArrangementImprover
 from ardour_integration import ArdourIntegration
 import config
 
@@ -55,14 +54,17 @@ class ControlPlane:
         # Initialize contextual intelligence system
         self.contextual_intelligence = ContextualIntelligence(session_file)
         
-        # Initialize musical problem solvers
-        self.groove_improver = GrooveImprover()
-        self.harmony_fixer = HarmonyFixer()
-        self.arrangement_improver = ArrangementImprover()
+        # Musical problem solvers are imported and created on first use
+        self.groove_improver = None
+        self.harmony_fixer = None
+        self.arrangement_improver = None
         
         # Initialize Ardour integration
         self.ardour_integration = ArdourIntegration()
         
+        # Command type -> handler lookup used by execute()
+        self._dispatch = self._build_dispatch_table()
+        
         # Playback state (now handled by sequencer)
     
     def execute(self, command_text: str) -> str:
@@ -79,78 +81,89 @@ class ControlPlane:
         if command is None:
             return f"Unknown command: '{command_text}'. Type 'help' for available commands."
         
+        handler = self._dispatch.get(command.type)
+        if handler is None:
+            return f"Command '{command.type.value}' not yet implemented."
+        
         try:
-            # Update session state if needed
-            if command.type in [
+            return handler(command)
+        except Exception as e:
+            return f"Error executing command: {str(e)}"
+    
+    def _build_dispatch_table(self) -> Dict[CommandType, Callable[[Command], str]]:
+        """Map every supported command type to the handler that executes it.
+        
+        Returns:
+            Dictionary from command type to a handler taking the parsed command
+        """
+        handler_groups = [
+            # Session state updates
+            (self._handle_session_command, [
                 CommandType.SET_KEY, CommandType.SET_DENSITY, CommandType.SET_TEMPO,
                 CommandType.SET_RANDOMNESS, CommandType.SET_VELOCITY, CommandType.SET_REGISTER,
                 CommandType.TARGET
-            ]:
-                self.session.update_from_command(command)
-                return f"Updated: {self._format_command_result(command)}"
-            
-            # Handle playback commands
-            elif command.type in [CommandType.PLAY_SCALE, CommandType.PLAY_ARP, CommandType.PLAY_RANDOM]:
-                return self._handle_playback_command(command)
-            
-            # Handle control commands
-            elif command.type in [CommandType.CC, CommandType.MOD]:
-                return self._handle_control_command(command)
-            
-            # Handle OSC style control commands
-            elif command.type in [
+            ]),
+            # Playback commands
+            (self._handle_playback_command, [
+                CommandType.PLAY_SCALE, CommandType.PLAY_ARP, CommandType.PLAY_RANDOM
+            ]),
+            # Control commands
+            (self._handle_control_command, [CommandType.CC, CommandType.MOD]),
+            # OSC style control commands
+            (self._handle_osc_command, [
                 CommandType.SET_SWING, CommandType.SET_ACCENT, 
                 CommandType.SET_HUMANIZE_TIMING, CommandType.SET_HUMANIZE_VELOCITY,
                 CommandType.SET_OSC_ENABLED, CommandType.SET_OSC_PORT,
                 CommandType.SET_STYLE_PRESET, CommandType.OSC_RESET
-            ]:
-                return self._handle_osc_command(command)
-            
-            # Handle contextual intelligence commands
-            elif command.type in [
+            ]),
+            # Contextual intelligence commands
+            (self._handle_contextual_intelligence_command, [
                 CommandType.LOAD_PROJECT, CommandType.ANALYZE_BASS, CommandType.ANALYZE_MELODY,
                 CommandType.ANALYZE_HARMONY, CommandType.ANALYZE_RHYTHM, CommandType.ANALYZE_ALL,
                 CommandType.GET_SUGGESTIONS, CommandType.APPLY_SUGGESTION, CommandType.SHOW_FEEDBACK,
                 CommandType.CLEAR_FEEDBACK
-            ]:
-                return self._handle_contextual_intelligence_command(command)
-            
-            # Handle musical problem solver commands
-            elif command.type in [
+            ]),
+            # Musical problem solver commands
+            (self._handle_musical_solver_command, [
                 CommandType.IMPROVE_GROOVE, CommandType.FIX_HARMONY, CommandType.IMPROVE_ARRANGEMENT
-            ]:
-                return self._handle_musical_solver_command(command)
-            
-            # Handle Ardour integration commands
-            elif command.type in [
+            ]),
+            # Ardour integration commands
+            (self._handle_ardour_command, [
                 CommandType.ARDOUR_CONNECT, CommandType.ARDOUR_DISCONNECT, CommandType.ARDOUR_LIST_TRACKS,
                 CommandType.ARDOUR_EXPORT_SELECTED, CommandType.ARDOUR_IMPORT_MIDI,
                 CommandType.ARDOUR_ANALYZE_SELECTED, CommandType.ARDOUR_IMPROVE_SELECTED
-            ]:
-                return self._handle_ardour_command(command)
-            
-            # Handle Musical Scribe commands
-            elif command.type in [
+            ]),
+            # Musical Scribe commands
+            (self._handle_musical_scribe_command, [
                 CommandType.MUSICAL_SCRIBE_ENHANCE, CommandType.MUSICAL_SCRIBE_ANALYZE,
                 CommandType.MUSICAL_SCRIBE_PROMPT, CommandType.MUSICAL_SCRIBE_STATUS
-            ]:
-                return self._handle_musical_scribe_command(command)
-            
-            # Handle system commands
-            elif command.type == CommandType.STOP:
-                return self._handle_stop_command()
-            
-            elif command.type == CommandType.STATUS:
-                return self.session.get_status_text()
-            
-            elif command.type == CommandType.HELP:
-                return self.parser.get_help_text()
-            
-            else:
-                return f"Command '{command.type.value}' not yet implemented."
+            ]),
+        ]
         
-        except Exception as e:
-            return f"Error executing command: {str(e)}"
+        dispatch = {
+            command_type: handler
+            for handler, command_types in handler_groups
+            for command_type in command_types
+        }
+        
+        # System commands
+        dispatch[CommandType.STOP] = lambda command: self._handle_stop_command()
+        dispatch[CommandType.STATUS] = lambda command: self.session.get_status_text()
+        dispatch[CommandType.HELP] = lambda command: self.parser.get_help_text()
+        
+        return dispatch
+    
+    def _handle_session_command(self, command: Command) -> str:
+        """Apply a command that updates session state.
+        
+        Args:
+            command: The session command to apply
+            
+        Returns:
+            Response message describing the update
+        """
+        self.session.update_from_command(command)
+        return f"Updated: {self._format_command_result(command)}"
     
     def _handle_playback_command(self, command: Command) -> str:
         """Handle a playback command (play scale, arp, random).
@@ -415,11 +428,10 @@ class ControlPlane:
         if not feedback_list:
             return "No visual feedback available."
         
-        formatted = "Visual Feedback:\n"
-        for feedback in feedback_list:
-            formatted += f"- {feedback.element.value.title()}: {feedback.message}\n"
+        lines = ["Visual Feedback:"]
+        lines.extend(f"- {feedback.element.value.title()}: {feedback.message}" for feedback in feedback_list)
         
-        return formatted
+        return "\n".join(lines) + "\n"
     
     def _handle_musical_solver_command(self, command: Command) -> str:
         """Handle a musical problem solver command.
@@ -434,21 +446,27 @@ class ControlPlane:
         if not self.contextual_intelligence.current_project:
             return "Please load a MIDI project first using 'load [filename]' before using musical problem solvers."
         
-        # Get the current project file path (we'll need to store this)
-        # For now, we'll use a placeholder - in a real implementation, we'd store the file path
-        project_path = "current_project.mid"  # This should be stored when loading
+        # Work on the loaded project's notes directly instead of re-reading a MIDI file
+        notes = self.contextual_intelligence.current_project.get_all_notes()
         
         try:
+            # Import the solvers (and NumPy behind them) only when a solver command runs
+            if self.groove_improver is None:
+                from musical_solvers import GrooveImprover, HarmonyFixer, ArrangementImprover
+                self.groove_improver = GrooveImprover()
+                self.harmony_fixer = HarmonyFixer()
+                self.arrangement_improver = ArrangementImprover()
+            
             if command.type == CommandType.IMPROVE_GROOVE:
-                solution = self.groove_improver.improve_groove(project_path)
+                solution = self.groove_improver.improve_groove_from_notes(notes)
                 return self._format_musical_solution("Groove", solution)
             
             elif command.type == CommandType.FIX_HARMONY:
-                solution = self.harmony_fixer.fix_harmony(project_path)
+                solution = self.harmony_fixer.fix_harmony_from_notes(notes)
                 return self._format_musical_solution("Harmony", solution)
             
             elif command.type == CommandType.IMPROVE_ARRANGEMENT:
-                solution = self.arrangement_improver.improve_arrangement(project_path)
+                solution = self.arrangement_improver.improve_arrangement_from_notes(notes)
                 return self._format_musical_solution("Arrangement", solution)
             
             else:
@@ -470,20 +488,18 @@ class ControlPlane:
         if not solution.changes_made:
             return f"{problem_type} Analysis: {solution.explanation}"
         
-        response = f"🎵 {problem_type} Improvements Made:\n\n"
-        response += f"{solution.explanation}\n\n"
+        lines = [f"🎵 {problem_type} Improvements Made:", "", solution.explanation, ""]
         
         if solution.changes_made:
-            response += "Changes Applied:\n"
-            for change in solution.changes_made:
-                response += f"• {change}\n"
+            lines.append("Changes Applied:")
+            lines.extend(f"• {change}" for change in solution.changes_made)
         
-        response += f"\nConfidence: {solution.confidence:.1%}"
+        lines.extend(["", f"Confidence: {solution.confidence:.1%}"])
         
         if solution.audio_preview_path:
-            response += f"\n\nAudio preview saved to: {solution.audio_preview_path}"
+            lines.extend(["", f"Audio preview saved to: {solution.audio_preview_path}"])
         
-        return response
+        return "\n".join(lines)
     
     def _handle_ardour_command(self, command: Command) -> str:
         """Handle an Ardour integration command.
@@ -535,29 +551,26 @@ class ControlPlane:
                     return f"Ardour Analysis: {analysis['error']}"
                 else:
                     # Format analysis results
-                    result = "Ardour Analysis Results:\n\n"
+                    lines = ["Ardour Analysis Results:", ""]
                     for element, feedback in analysis.items():
                         if feedback:
-                            result += f"{element.title()}:\n"
-                            for item in feedback:
-                                result += f"  - {item.message}\n"
-                            result += "\n"
-                    return result
+                            lines.append(f"{element.title()}:")
+                            lines.extend(f"  - {item.message}" for item in feedback)
+                            lines.append("")
+                    return "\n".join(lines) + "\n"
             
             elif command.type == CommandType.ARDOUR_IMPROVE_SELECTED:
                 # For now, default to groove improvement
                 improvement = self.ardour_integration.improve_selected_region("groove")
-                if "error" in improvement:
-                    return f"Ardour Improvement: {improvement['error']}"
+                if not improvement.success:
+                    return f"Ardour Improvement: {improvement.error}"
                 else:
-                    result = f"Ardour Improvement ({improvement['improvement_type']}):\n\n"
-                    result += f"{improvement['explanation']}\n\n"
-                    if improvement['changes_made']:
-                        result += "Changes Made:\n"
-                        for change in improvement['changes_made']:
-                            result += f"  - {change}\n"
-                    result += f"\nConfidence: {improvement['confidence']:.1%}"
-                    return result
+                    lines = [f"Ardour Improvement ({improvement.improvement_type}):", "", improvement.explanation, ""]
+                    if improvement.changes_made:
+                        lines.append("Changes Made:")
+                        lines.extend(f"  - {change}" for change in improvement.changes_made)
+                    lines.extend(["", f"Confidence: {improvement.confidence:.1%}"])
+                    return "\n".join(lines)
             
             else:
                 return f"Ardour: Unknown command '{command.type.value}'"
@@ -593,20 +606,27 @@ class ControlPlane:
                 result = self.musical_scribe_integration.enhance_project(project_path, user_request)
                 
                 if result['success']:
-                    response = f"Musical Scribe Enhancement: {user_request}\n\n"
-                    response += f"Generated {len(result['patterns'])} patterns:\n\n"
+                    lines = [
+                        f"Musical Scribe Enhancement: {user_request}",
+                        "",
+                        f"Generated {len(result['patterns'])} patterns:",
+                        ""
+                    ]
                     
                     for i, pattern in enumerate(result['patterns'], 1):
-                        response += f"{i}. {pattern['name']}\n"
-                        response += f"   Description: {pattern['description']}\n"
-                        response += f"   Type: {pattern['enhancement_type']}\n"
-                        response += f"   Confidence: {pattern['confidence_score']:.1%}\n"
-                        response += f"   Justification: {pattern['musical_justification']}\n\n"
+                        lines.extend([
+                            f"{i}. {pattern['name']}",
+                            f"   Description: {pattern['description']}",
+                            f"   Type: {pattern['enhancement_type']}",
+                            f"   Confidence: {pattern['confidence_score']:.1%}",
+                            f"   Justification: {pattern['musical_justification']}",
+                            ""
+                        ])
                     
                     if result.get('fallback_used'):
-                        response += "Note: Used fallback system due to Musical Scribe limitations.\n"
+                        lines.append("Note: Used fallback system due to Musical Scribe limitations.")
                     
-                    return response
+                    return "\n".join(lines) + "\n"
                 else:
                     return f"Musical Scribe: Enhancement failed - {result.get('error', 'Unknown error')}"
             
@@ -617,39 +637,45 @@ class ControlPlane:
                 analysis = self.musical_scribe_integration.analyze_project_context(project_path)
                 
                 if analysis['success']:
-                    response = "Musical Scribe Project Analysis:\n\n"
-                    response += f"Project: {analysis['project_info']['name']}\n"
-                    response += f"Tempo: {analysis['project_info']['tempo']} BPM\n"
-                    response += f"Time Signature: {analysis['project_info']['time_signature']}\n"
-                    response += f"Tracks: {analysis['project_info']['tracks']}\n\n"
+                    project_info = analysis['project_info']
+                    lines = [
+                        "Musical Scribe Project Analysis:",
+                        "",
+                        f"Project: {project_info['name']}",
+                        f"Tempo: {project_info['tempo']} BPM",
+                        f"Time Signature: {project_info['time_signature']}",
+                        f"Tracks: {project_info['tracks']}",
+                        ""
+                    ]
                     
                     # Musical context
                     mc = analysis['musical_context']
-                    response += "Musical Context:\n"
-                    response += f"- Key: {mc['harmonic_analysis']['key_signature'] or 'Unknown'}\n"
-                    response += f"- Harmonic Complexity: {mc['harmonic_analysis']['harmonic_complexity']}\n"
-                    response += f"- Groove Quality: {mc['rhythmic_analysis']['groove_quality']}\n"
-                    response += f"- Primary Genre: {mc['style_analysis']['primary_genre']}\n"
-                    response += f"- Complexity Level: {mc['style_analysis']['complexity_level']}\n"
-                    response += f"- Musical Coherence: {mc['musical_coherence_score']:.1%}\n\n"
+                    lines.extend([
+                        "Musical Context:",
+                        f"- Key: {mc['harmonic_analysis']['key_signature'] or 'Unknown'}",
+                        f"- Harmonic Complexity: {mc['harmonic_analysis']['harmonic_complexity']}",
+                        f"- Groove Quality: {mc['rhythmic_analysis']['groove_quality']}",
+                        f"- Primary Genre: {mc['style_analysis']['primary_genre']}",
+                        f"- Complexity Level: {mc['style_analysis']['complexity_level']}",
+                        f"- Musical Coherence: {mc['musical_coherence_score']:.1%}",
+                        ""
+                    ])
                     
                     # Enhancement opportunities
                     eo = mc['enhancement_opportunities']
                     if eo['missing_elements']:
-                        response += "Missing Elements:\n"
-                        for element in eo['missing_elements']:
-                            response += f"- {element.replace('_', ' ').title()}\n"
-                        response += "\n"
+                        lines.append("Missing Elements:")
+                        lines.extend(f"- {element.replace('_', ' ').title()}" for element in eo['missing_elements'])
+                        lines.append("")
                     
                     if eo['weak_areas']:
-                        response += "Weak Areas:\n"
-                        for area in eo['weak_areas']:
-                            response += f"- {area.replace('_', ' ').title()}\n"
-                        response += "\n"
+                        lines.append("Weak Areas:")
+                        lines.extend(f"- {area.replace('_', ' ').title()}" for area in eo['weak_areas'])
+                        lines.append("")
                     
-                    response += f"Priority Level: {eo['priority_level'].upper()}\n"
+                    lines.append(f"Priority Level: {eo['priority_level'].upper()}")
                     
-                    return response
+                    return "\n".join(lines) + "\n"
                 else:
                     return f"Musical Scribe: Analysis failed - {analysis.get('error', 'Unknown error')}"
             
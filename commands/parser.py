@@ -8,7 +8,8 @@ Command objects that can be executed by the control plane.
 from __future__ import annotations
 
 import re
-from typing import Optional
+from functools import lru_cache
+from typing import Optional, Tuple
 
 from .types import Command, CommandType, Density, Mode
 
@@ -321,6 +322,10 @@ class CommandParser:
             self.compiled_patterns[cmd_type] = [
                 re.compile(pattern, re.IGNORECASE) for pattern in patterns
             ]
+        
+        # Repeated commands ("status", "play scale C major") skip the pattern scan;
+        # parse() copies the cached params so callers never share them
+        self._match_cached = lru_cache(maxsize=256)(self._match)
     
     def parse(self, text: str) -> Optional[Command]:
         """Parse a command string into a Command object.
@@ -335,16 +340,31 @@ class CommandParser:
         if not text:
             return None
         
+        matched = self._match_cached(text)
+        if matched is None:
+            return None
+        
+        cmd_type, params = matched
+        return Command(
+            type=cmd_type,
+            params=dict(params),
+            raw_text=text
+        )
+    
+    def _match(self, text: str) -> Optional[Tuple[CommandType, dict]]:
+        """Find the first pattern matching the text and extract its parameters.
+        
+        Args:
+            text: The stripped command text
+            
+        Returns:
+            Tuple of (command type, parameters) if a pattern matches, None otherwise
+        """
         for cmd_type, patterns in self.compiled_patterns.items():
             for pattern in patterns:
                 match = pattern.match(text)
                 if match:
-                    params = self._extract_params(cmd_type, match.groups())
-                    return Command(
-                        type=cmd_type,
-                        params=params,
-                        raw_text=text
-                    )
+                    return cmd_type, self._extract_params(cmd_type, match.groups())
         
         return None
     
@@ -137,6 +137,9 @@ class SessionState:
 @dataclass
 class Note:
     """Represents a musical note with timing and dynamics."""
+    # Patterns create many notes; slots drop the per-instance __dict__
+    __slots__ = ("pitch", "velocity", "start_beat", "duration_beats")
+    
     pitch: int
     velocity: int
     start_beat: float
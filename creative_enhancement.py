@@ -627,8 +627,7 @@ def demo_creative_enhancement():
         context=context
     )
     
-    for intent in intents:
-        collection.add_intent(intent)
+    collection.add_intents(intents)
     
     # Test creative enhancements
     print("=== Creative Enhancements ===")
@@ -15,23 +15,138 @@ Key Features:
 """
 
 import argparse
-import json
+import atexit
 import os
+import re
 import sys
-from typing import Optional, List, Dict, Any
-from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
 
-from enhanced_musical_conversation_engine import EnhancedMusicalConversationEngine, MusicalSuggestion
+try:
+    import readline
+    READLINE_AVAILABLE = True
+except ImportError:
+    READLINE_AVAILABLE = False
+
+
+# Banner rules are built once instead of on every print
+_BANNER_RULE = "=" * 60
+_SECTION_RULE = "-" * 40
+_SUGGESTIONS_RULE = "-" * 50
+_PROMPT_RULE = "-" * 60
+_STATUS_RULE = "-" * 30
+
+# Phrases that prompt a round of musical suggestions, matched as substrings
+_SUGGESTION_TRIGGERS = [
+    'suggest', 'help with', 'what should', 'how can i',
+    'i need help', 'i can\'t figure out', 'bridge', 'chorus',
+    'verse', 'intro', 'outro', 'chord', 'melody', 'bass'
+]
+_SUGGESTION_TRIGGER_PATTERN = re.compile(
+    "|".join(re.escape(trigger) for trigger in _SUGGESTION_TRIGGERS),
+    re.IGNORECASE
+)
+
+# Interactive commands offered for tab completion
+_COMPLETION_COMMANDS = [
+    'help', 'quit', 'exit', 'status', 'suggestions', 'context', 'discovery',
+    'enhancements', 'prompt', 'generate prompt', 'generate suggestions',
+    'generate enhancements', 'enhance low', 'enhance medium', 'enhance high'
+]
+_HISTORY_FILE = os.path.join(os.path.expanduser("~"), ".yesand_music_history")
+
+
+def _complete_command(text: str, state: int) -> Optional[str]:
+    """Readline completer over the interactive command names."""
+    matches = [command for command in _COMPLETION_COMMANDS if command.startswith(text.lower())]
+    return matches[state] if state < len(matches) else None
+
+
+def _save_history() -> None:
+    """Write the readline history, ignoring an unwritable home directory."""
+    try:
+        readline.write_history_file(_HISTORY_FILE)
+    except OSError:
+        pass
+
+
+def _setup_readline() -> None:
+    """Enable input history and command completion when readline is available."""
+    if not READLINE_AVAILABLE:
+        return
+    
+    try:
+        readline.read_history_file(_HISTORY_FILE)
+    except OSError:
+        pass
+    atexit.register(_save_history)
+    
+    # Complete against the whole line so multi-word commands work
+    readline.set_completer_delims("")
+    readline.set_completer(_complete_command)
+    if "libedit" in (readline.__doc__ or ""):
+        readline.parse_and_bind("bind ^I rl_complete")
+    else:
+        readline.parse_and_bind("tab: complete")
+
+
+def _print_banner(title: str) -> None:
+    """Print a title followed by the banner rule in a single write."""
+    sys.stdout.write(f"{title}\n{_BANNER_RULE}\n")
+
+
+def _print_section(title: str, rule: str = _SECTION_RULE) -> None:
+    """Print a section title followed by its rule in a single write."""
+    sys.stdout.write(f"\n{title}\n{rule}\n")
+
+
+def _print_lines(lines: List[str]) -> None:
+    """Print a block of lines in a single write."""
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 class EnhancedMusicalConversationCLI:
     """Main CLI interface for enhanced musical conversation system"""
     
     def __init__(self):
+        # Imported here so --help doesn't pay for pydantic and the discovery stack
+        from enhanced_musical_conversation_engine import EnhancedMusicalConversationEngine
         self.conversation_engine = EnhancedMusicalConversationEngine()
         self.current_project_path = None
         self.current_suggestions = []
         self.current_prompt = None
+        
+        # Results of state-only queries, valid for one engine state_version
+        self._memo_cache: Dict[str, Any] = {}
+        self._memo_version = -1
+        
+        self._commands = self._build_command_table()
+        self._prefix_commands = (
+            ('generate ', self._handle_generate_command),
+            ('enhance ', self._handle_enhance_command),
+        )
+    
+    def _build_command_table(self) -> Dict[str, Callable[[], None]]:
+        """Map each single-word interactive command to its handler."""
+        return {
+            'help': self._show_help,
+            'status': self._show_status,
+            'suggestions': self._show_suggestions,
+            'context': self._show_context,
+            'discovery': self._show_discovery_summary,
+            'enhancements': self._show_enhancements,
+            'prompt': self._show_prompt,
+        }
+    
+    def _memo(self, name: str, compute: Callable[[], Any]) -> Any:
+        """Return compute() for the current engine state, reusing an earlier result."""
+        version = self.conversation_engine.state_version
+        if version != self._memo_version:
+            self._memo_cache.clear()
+            self._memo_version = version
+        
+        if name not in self._memo_cache:
+            self._memo_cache[name] = compute()
+        return self._memo_cache[name]
     
     def safe_input(self, prompt: str) -> Optional[str]:
         """Safely get user input with EOF error handling"""
@@ -47,8 +162,8 @@ class EnhancedMusicalConversationCLI:
 
     def start_interactive_mode(self, project_path: Optional[str] = None, initial_input: str = None):
         """Start interactive conversation mode with EOF handling"""
-        print("🎵 Enhanced Musical Conversation System")
-        print("=" * 60)
+        _setup_readline()
+        _print_banner("🎵 Enhanced Musical Conversation System")
         
         # Start conversation
         print(self.conversation_engine.start_conversation(project_path, initial_input))
@@ -57,8 +172,7 @@ class EnhancedMusicalConversationCLI:
             self.current_project_path = project_path
             print(f"📁 Project loaded: {project_path}")
         
-        print("\nType 'help' for available commands, 'quit' to exit.")
-        print("-" * 60)
+        _print_section("Type 'help' for available commands, 'quit' to exit.", _PROMPT_RULE)
         
         while True:
             try:
@@ -67,27 +181,20 @@ class EnhancedMusicalConversationCLI:
                 if user_input is None:  # EOF or KeyboardInterrupt
                     break
                 
-                if user_input.lower() in ['quit', 'exit', 'q']:
+                command = user_input.lower()
+                if command in ('quit', 'exit', 'q'):
                     print("👋 Goodbye! Happy music making!")
                     break
-                elif user_input.lower() == 'help':
-                    self._show_help()
-                elif user_input.lower() == 'status':
-                    self._show_status()
-                elif user_input.lower() == 'suggestions':
-                    self._show_suggestions()
-                elif user_input.lower() == 'context':
-                    self._show_context()
-                elif user_input.lower() == 'discovery':
-                    self._show_discovery_summary()
-                elif user_input.lower() == 'enhancements':
-                    self._show_enhancements()
-                elif user_input.lower() == 'prompt':
-                    self._show_prompt()
-                elif user_input.lower().startswith('generate '):
-                    self._handle_generate_command(user_input)
-                elif user_input.lower().startswith('enhance '):
-                    self._handle_enhance_command(user_input)
+                
+                handler = self._commands.get(command)
+                if handler is not None:
+                    handler()
+                    continue
+                
+                for prefix, prefix_handler in self._prefix_commands:
+                    if command.startswith(prefix):
+                        prefix_handler(user_input)
+                        break
                 else:
                     # Process as conversation input
                     response = self.conversation_engine.process_user_input(user_input)
@@ -103,8 +210,7 @@ class EnhancedMusicalConversationCLI:
     
     def start_demo_mode(self, project_path: Optional[str] = None):
         """Start demo mode with simulated conversation"""
-        print("🎵 Enhanced Musical Conversation System - Demo Mode")
-        print("=" * 60)
+        _print_banner("🎵 Enhanced Musical Conversation System - Demo Mode")
         
         # Start conversation
         print(self.conversation_engine.start_conversation(project_path, "I'm working on a jazz piece"))
@@ -113,8 +219,7 @@ class EnhancedMusicalConversationCLI:
             self.current_project_path = project_path
             print(f"📁 Project loaded: {project_path}")
         
-        print("\n🎵 Running simulated conversation...")
-        print("-" * 40)
+        _print_section("🎵 Running simulated conversation...")
         
         # Simulate a conversation
         demo_responses = [
@@ -130,8 +235,7 @@ class EnhancedMusicalConversationCLI:
             result = self.conversation_engine.process_user_input(response)
             print(f"🤖 AI: {result}")
         
-        print("\n🎵 Testing suggestion generation...")
-        print("-" * 40)
+        _print_section("🎵 Testing suggestion generation...")
         
         # Test suggestion generation
         suggestions = self.conversation_engine.get_musical_suggestions()
@@ -143,8 +247,7 @@ class EnhancedMusicalConversationCLI:
                 print(f"   Confidence: {suggestion.confidence_score:.1%}")
                 print()
         
-        print("\n🎵 Testing prompt generation...")
-        print("-" * 40)
+        _print_section("🎵 Testing prompt generation...")
         
         # Test prompt generation
         prompt = self.conversation_engine.generate_midi_prompt("4-bar", "rhythm and harmony")
@@ -187,8 +290,7 @@ System:
     
     def _show_status(self):
         """Show current system status"""
-        print("\n📊 System Status:")
-        print("-" * 30)
+        _print_section("📊 System Status:", _STATUS_RULE)
         
         # Discovery status
         if self.conversation_engine.conversation_context:
@@ -217,9 +319,8 @@ System:
             print("❌ No active conversation. Start by describing your musical vision.")
             return
         
-        print("\n🎵 Current Musical Context:")
-        print("-" * 40)
-        print(self.conversation_engine.get_context_summary())
+        _print_section("🎵 Current Musical Context:")
+        print(self._memo("context", self.conversation_engine.get_context_summary))
     
     def _show_discovery_summary(self):
         """Show intent discovery summary"""
@@ -227,26 +328,30 @@ System:
             print("❌ No active conversation. Start by describing your musical vision.")
             return
         
-        summary = self.conversation_engine.get_discovery_summary()
+        summary = self._memo("discovery", self.conversation_engine.get_discovery_summary)
         
-        print("\n🔍 Intent Discovery Summary:")
-        print("-" * 40)
+        _print_section("🔍 Intent Discovery Summary:")
         
         if "error" in summary:
             print(f"❌ {summary['error']}")
             return
         
-        print(f"Total Intents: {summary['discovery_metrics']['total_intents']}")
-        print(f"Intent Types: {summary['discovery_metrics']['intent_types_discovered']}")
-        print(f"Conversation Turns: {summary['discovery_metrics']['conversation_turns']}")
-        print(f"Discovery Stage: {summary['discovery_metrics']['discovery_stage']}")
-        print(f"Completeness: {summary['discovery_metrics']['completeness_score']:.1%}")
+        metrics = summary['discovery_metrics']
+        lines = [
+            f"Total Intents: {metrics['total_intents']}",
+            f"Intent Types: {metrics['intent_types_discovered']}",
+            f"Conversation Turns: {metrics['conversation_turns']}",
+            f"Discovery Stage: {metrics['discovery_stage']}",
+            f"Completeness: {metrics['completeness_score']:.1%}",
+        ]
         
         if summary['musical_examples']:
-            print(f"Musical Examples: {', '.join(summary['musical_examples'])}")
+            lines.append(f"Musical Examples: {', '.join(summary['musical_examples'])}")
         
         if summary['musical_insights']:
-            print(f"Insights: {', '.join(summary['musical_insights'])}")
+            lines.append(f"Insights: {', '.join(summary['musical_insights'])}")
+        
+        _print_lines(lines)
     
     def _show_enhancements(self):
         """Show creative enhancement suggestions"""
@@ -258,8 +363,7 @@ System:
             print("❌ No creative enhancements available. Complete the discovery process first.")
             return
         
-        print("\n🎨 Creative Enhancement Suggestions:")
-        print("-" * 40)
+        _print_section("🎨 Creative Enhancement Suggestions:")
         
         for i, enhancement in enumerate(self.conversation_engine.conversation_context.creative_enhancements, 1):
             print(f"{i}. {enhancement['enhancement']}")
@@ -280,8 +384,7 @@ System:
         prompt = self.conversation_engine.generate_midi_prompt("4-bar", "all elements")
         self.current_prompt = prompt
         
-        print("\n🎼 Generated MIDI Prompt:")
-        print("-" * 40)
+        _print_section("🎼 Generated MIDI Prompt:")
         print(prompt)
     
     def _show_suggestions(self):
@@ -290,29 +393,24 @@ System:
             print("❌ No suggestions available. Complete the discovery process first!")
             return
         
-        print("\n💡 Current Musical Suggestions:")
-        print("-" * 40)
+        _print_section("💡 Current Musical Suggestions:")
         
+        lines = []
         for i, suggestion in enumerate(self.current_suggestions, 1):
-            print(f"{i}. {suggestion.title}")
-            print(f"   {suggestion.description}")
-            print(f"   Confidence: {suggestion.confidence_score:.1%}")
-            print(f"   Type: {suggestion.suggestion_type}")
+            lines.append(f"{i}. {suggestion.title}")
+            lines.append(f"   {suggestion.description}")
+            lines.append(f"   Confidence: {suggestion.confidence_score:.1%}")
+            lines.append(f"   Type: {suggestion.suggestion_type}")
             
             if suggestion.enhancement_suggestions:
-                print(f"   Enhancements: {len(suggestion.enhancement_suggestions)} available")
-            print()
+                lines.append(f"   Enhancements: {len(suggestion.enhancement_suggestions)} available")
+            lines.append("")
+        
+        _print_lines(lines)
     
     def _should_generate_suggestions(self, user_input: str) -> bool:
         """Check if we should generate suggestions based on user input"""
-        suggestion_triggers = [
-            'suggest', 'help with', 'what should', 'how can i',
-            'i need help', 'i can\'t figure out', 'bridge', 'chorus',
-            'verse', 'intro', 'outro', 'chord', 'melody', 'bass'
-        ]
-        
-        user_input_lower = user_input.lower()
-        return any(trigger in user_input_lower for trigger in suggestion_triggers)
+        return _SUGGESTION_TRIGGER_PATTERN.search(user_input) is not None
     
     def _generate_and_show_suggestions(self):
         """Generate and show musical suggestions"""
@@ -324,14 +422,15 @@ System:
         self.current_suggestions = suggestions
         
         if suggestions:
-            print("\n💡 I've generated some musical suggestions for you:")
-            print("-" * 50)
+            _print_section("💡 I've generated some musical suggestions for you:", _SUGGESTIONS_RULE)
             
+            lines = []
             for i, suggestion in enumerate(suggestions, 1):
-                print(f"{i}. {suggestion.title}")
-                print(f"   {suggestion.description}")
-                print(f"   Confidence: {suggestion.confidence_score:.1%}")
-                print()
+                lines.append(f"{i}. {suggestion.title}")
+                lines.append(f"   {suggestion.description}")
+                lines.append(f"   Confidence: {suggestion.confidence_score:.1%}")
+                lines.append("")
+            _print_lines(lines)
         else:
             print("❌ I need more context to generate suggestions. Tell me more about your musical vision!")
     
@@ -378,7 +477,7 @@ System:
             level
         )
         
-        self.conversation_engine.conversation_context.creative_enhancements = enhancements
+        self.conversation_engine.set_creative_enhancements(enhancements)
         
         print(f"✅ Generated {len(enhancements)} creative enhancements at {level} level:")
         for i, enhancement in enumerate(enhancements, 1):
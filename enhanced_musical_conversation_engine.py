@@ -8,18 +8,126 @@ conversation flow and context we've built.
 
 import json
 import os
-from typing import Dict, List, Optional, Any, Tuple
-from dataclasses import dataclass
+import re
+from typing import Dict, List, NamedTuple, Optional, Any, Tuple
+from dataclasses import asdict, dataclass, is_dataclass
 from datetime import datetime
+from functools import lru_cache
 import uuid
 
-from schemas import MusicalContext, IntentCollection, IntentType
+from schemas import MusicalContext, MusicalIntent, IntentCollection, IntentType
 from intent_discovery_agent import MusicalIntentDiscoveryAgent
 from creative_enhancement import (
     MusicalCreativityEngine, ContextualPromptGenerator,
     suggest_musical_enhancements, generate_musical_prompt
 )
 
+# Optional: orjson speeds up save_conversation; the json module writes the same data
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+# Keywords that select a suggestion for each intent type, compiled once
+_RHYTHMIC_KEYWORD_PATTERN = re.compile(r'swung|syncopated', re.IGNORECASE | re.ASCII)
+_HARMONIC_KEYWORD_PATTERN = re.compile(r'jazz|seventh', re.IGNORECASE | re.ASCII)
+_MELODIC_KEYWORD_PATTERN = re.compile(r'ascending|sparse', re.IGNORECASE | re.ASCII)
+
+# Keyword pattern and keyword priority per intent type, in the order suggestions are listed
+_SUGGESTION_RULES: Dict[str, Tuple[re.Pattern, Tuple[str, ...]]] = {
+    IntentType.RHYTHMIC: (_RHYTHMIC_KEYWORD_PATTERN, ("swung", "syncopated")),
+    IntentType.HARMONIC: (_HARMONIC_KEYWORD_PATTERN, ("jazz", "seventh")),
+    IntentType.MELODIC: (_MELODIC_KEYWORD_PATTERN, ("ascending", "sparse")),
+}
+
+
+class SuggestionTemplate(NamedTuple):
+    """Fixed content of a suggestion; fields follow MusicalSuggestion after suggestion_id"""
+    title: str
+    description: str
+    musical_reasoning: str
+    implementation_notes: str
+    confidence_score: float
+    suggestion_type: str
+
+
+_SUGGESTION_TEMPLATES: Dict[str, SuggestionTemplate] = {
+    "swung": SuggestionTemplate(
+        title="Enhance Swung Feel",
+        description="Build on the swung rhythm with syncopation and rhythmic displacement",
+        musical_reasoning="Swung rhythms can be enhanced with additional syncopation and off-beat accents",
+        implementation_notes="Try adding anticipations and delayed attacks to enhance the swing feel",
+        confidence_score=0.8,
+        suggestion_type="rhythm"
+    ),
+    "syncopated": SuggestionTemplate(
+        title="Develop Syncopation",
+        description="Expand the syncopated patterns with polyrhythmic elements",
+        musical_reasoning="Syncopated rhythms can be developed with more complex rhythmic patterns",
+        implementation_notes="Try adding polyrhythmic elements or cross-rhythms",
+        confidence_score=0.7,
+        suggestion_type="rhythm"
+    ),
+    "jazz": SuggestionTemplate(
+        title="Expand Jazz Harmony",
+        description="Add chord extensions and jazz harmony techniques",
+        musical_reasoning="Jazz harmony can be expanded with extensions, alterations, and substitutions",
+        implementation_notes="Try adding 9ths, 11ths, and 13ths to your chord progressions",
+        confidence_score=0.8,
+        suggestion_type="harmony"
+    ),
+    "seventh": SuggestionTemplate(
+        title="Develop Seventh Chords",
+        description="Build on the seventh chord foundation with secondary dominants",
+        musical_reasoning="Seventh chords can be developed with secondary dominants and extensions",
+        implementation_notes="Try adding secondary dominants before your seventh chords",
+        confidence_score=0.7,
+        suggestion_type="harmony"
+    ),
+    "ascending": SuggestionTemplate(
+        title="Develop Ascending Melody",
+        description="Build on the ascending melodic idea with sequences and development",
+        musical_reasoning="Ascending melodies can be developed with sequences and motivic development",
+        implementation_notes="Try creating melodic sequences that build on the ascending pattern",
+        confidence_score=0.8,
+        suggestion_type="melody"
+    ),
+    "sparse": SuggestionTemplate(
+        title="Add Melodic Detail",
+        description="Enhance the sparse melody with ornamentation and passing tones",
+        musical_reasoning="Sparse melodies can be enhanced with tasteful ornamentation",
+        implementation_notes="Try adding passing tones, neighbor tones, and melodic ornaments",
+        confidence_score=0.7,
+        suggestion_type="melody"
+    ),
+}
+
+
+@lru_cache(maxsize=1024)
+def _suggestion_keyword(intent_type: str, concept: str) -> Optional[str]:
+    """Return the highest-priority suggestion keyword in a concept, cached per concept."""
+    rule = _SUGGESTION_RULES.get(intent_type)
+    if rule is None:
+        return None
+    
+    pattern, keywords = rule
+    found = {match.lower() for match in pattern.findall(concept)}
+    for keyword in keywords:
+        if keyword in found:
+            return keyword
+    return None
+
+
+def _json_default(value: Any) -> Any:
+    """Serialize values the stdlib encoder can't handle the way orjson does."""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if is_dataclass(value) and not isinstance(value, type):
+        return asdict(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
 
 @dataclass
 class MusicalSuggestion:
@@ -61,6 +169,9 @@ class EnhancedMusicalConversationEngine:
         self.creativity_engine = MusicalCreativityEngine()
         self.prompt_generator = ContextualPromptGenerator()
         self.conversation_mode = "discovery"  # "discovery", "enhancement", "generation"
+        self.state_version = 0  # Bumped whenever the conversation context changes
+        self._prompt_cache: Dict[Tuple[str, str], str] = {}
+        self._prompt_cache_version = -1
         
         # Musical knowledge base
         self.musical_styles = {
@@ -90,26 +201,28 @@ class EnhancedMusicalConversationEngine:
             session_id=session_id,
             discovery_complete=False
         )
+        self.state_version += 1
         
-        # Start discovery session
-        if initial_input:
-            result = discovery_agent.start_discovery_session(initial_input)
-        else:
-            result = discovery_agent.start_discovery_session()
+        # Start discovery session; the agent skips input processing when there is no initial input
+        result = discovery_agent.start_discovery_session(initial_input)
+        
+        # One clock read covers every record made for this interaction
+        now = datetime.now()
+        timestamp = now.isoformat()
         
         # Get initial intent collection
-        self.conversation_context.intent_collection = self._get_intent_collection_from_discovery_agent(discovery_agent)
+        self.conversation_context.intent_collection = self._get_intent_collection_from_discovery_agent(discovery_agent, now)
         
         # Record the initial interaction
         self.conversation_context.conversation_history.append({
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': timestamp,
             'type': 'system',
             'content': result['welcome']
         })
         
         if result['response']:
             self.conversation_context.conversation_history.append({
-                'timestamp': datetime.now().isoformat(),
+                'timestamp': timestamp,
                 'type': 'system',
                 'content': result['response']
             })
@@ -121,9 +234,15 @@ class EnhancedMusicalConversationEngine:
         if not self.conversation_context:
             return "Please start a conversation first with start_conversation()"
         
+        self.state_version += 1
+        
+        # One clock read covers every record made for this turn
+        now = datetime.now()
+        timestamp = now.isoformat()
+        
         # Add to conversation history
         self.conversation_context.conversation_history.append({
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': timestamp,
             'type': 'user',
             'content': user_input
         })
@@ -133,16 +252,19 @@ class EnhancedMusicalConversationEngine:
         
         # Update intent collection
         self.conversation_context.intent_collection = self._get_intent_collection_from_discovery_agent(
-            self.conversation_context.discovery_agent
+            self.conversation_context.discovery_agent, now
         )
         
         # Record the response
         self.conversation_context.conversation_history.append({
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': timestamp,
             'type': 'system',
             'content': result['response']
         })
         
+        # Collect the reply and its optional tails, joined once at the end
+        response_parts = [result['response']]
+        
         # Check if discovery is complete
         if result['discovery_complete'] and not self.conversation_context.discovery_complete:
             self.conversation_context.discovery_complete = True
@@ -153,26 +275,25 @@ class EnhancedMusicalConversationEngine:
                 self.conversation_context.intent_collection, 
                 "medium"
             )
-            self.conversation_context.creative_enhancements = enhancements
+            self.set_creative_enhancements(enhancements)
             
             # Add enhancement suggestions to response
             enhancement_text = self._format_enhancement_suggestions(enhancements)
-            result['response'] += f"\n\n🎨 **Creative Enhancement Suggestions:**\n{enhancement_text}"
+            response_parts.append(f"\n\n🎨 **Creative Enhancement Suggestions:**\n{enhancement_text}")
         
         # Add next question if available
         if result['next_question']:
-            next_question_text = f"\n\n**Next Question:** {result['next_question']['question']}"
+            response_parts.append(f"\n\n**Next Question:** {result['next_question']['question']}")
             if result['next_question']['suggested_follow_ups']:
                 follow_ups = ", ".join(result['next_question']['suggested_follow_ups'])
-                next_question_text += f"\n*Suggestions: {follow_ups}*"
-            result['response'] += next_question_text
+                response_parts.append(f"\n*Suggestions: {follow_ups}*")
         
         # Add musical insights if available
         if result['musical_insights']:
             insights_text = ", ".join(result['musical_insights'])
-            result['response'] += f"\n\n💡 **Musical Insights:** {insights_text}"
+            response_parts.append(f"\n\n💡 **Musical Insights:** {insights_text}")
         
-        return result['response']
+        return "".join(response_parts)
     
     def _format_enhancement_suggestions(self, enhancements: List[Dict[str, Any]]) -> str:
         """Format creative enhancement suggestions for display"""
@@ -187,19 +308,26 @@ class EnhancedMusicalConversationEngine:
         
         return "\n".join(enhancement_texts)
     
-    def _get_intent_collection_from_discovery_agent(self, discovery_agent) -> Optional[IntentCollection]:
-        """Get intent collection from discovery agent"""
-        if not discovery_agent.discovered_intents:
+    def _get_intent_collection_from_discovery_agent(
+        self, discovery_agent, now: Optional[datetime] = None
+    ) -> Optional[IntentCollection]:
+        """Get intent collection from discovery agent, adding only newly discovered intents"""
+        discovered_intents = discovery_agent.discovered_intents
+        if not discovered_intents:
             return None
         
-        # Create intent collection
-        collection = IntentCollection(
-            generation_id=f"conversation_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
-            context=discovery_agent.current_context
-        )
+        # The agent only ever appends intents, so the current collection is a prefix of them
+        collection = self.conversation_context.intent_collection
+        if collection is None:
+            collection = IntentCollection(
+                generation_id=f"conversation_{(now or datetime.now()).strftime('%Y%m%d_%H%M%S')}",
+                context=discovery_agent.current_context
+            )
+        elif len(collection.intents) < len(discovered_intents):
+            collection.generation_id = f"conversation_{(now or datetime.now()).strftime('%Y%m%d_%H%M%S')}"
+        collection.context = discovery_agent.current_context
         
-        for intent in discovery_agent.discovered_intents:
-            collection.add_intent(intent)
+        collection.add_intents(discovered_intents[len(collection.intents):])
         
         return collection
     
@@ -208,18 +336,7 @@ class EnhancedMusicalConversationEngine:
         if not self.conversation_context or not self.conversation_context.intent_collection:
             return []
         
-        suggestions = []
-        intent_collection = self.conversation_context.intent_collection
-        
-        # Generate suggestions based on discovered intents
-        if IntentType.RHYTHMIC in [intent.intent_type for intent in intent_collection.intents]:
-            suggestions.extend(self._generate_rhythmic_suggestions(intent_collection))
-        
-        if IntentType.HARMONIC in [intent.intent_type for intent in intent_collection.intents]:
-            suggestions.extend(self._generate_harmonic_suggestions(intent_collection))
-        
-        if IntentType.MELODIC in [intent.intent_type for intent in intent_collection.intents]:
-            suggestions.extend(self._generate_melodic_suggestions(intent_collection))
+        suggestions = self._generate_all_suggestions(self.conversation_context.intent_collection.intents)
         
         # Add creative enhancements to suggestions
         if self.conversation_context.creative_enhancements:
@@ -228,98 +345,26 @@ class EnhancedMusicalConversationEngine:
         
         return suggestions
     
-    def _generate_rhythmic_suggestions(self, intent_collection: IntentCollection) -> List[MusicalSuggestion]:
-        """Generate rhythmic suggestions based on discovered intents"""
-        suggestions = []
-        
-        # Find rhythmic intents
-        rhythmic_intents = [intent for intent in intent_collection.intents if intent.intent_type == IntentType.RHYTHMIC]
-        
-        for intent in rhythmic_intents:
-            if "swung" in intent.concept.lower():
-                suggestions.append(MusicalSuggestion(
-                    suggestion_id=str(uuid.uuid4()),
-                    title="Enhance Swung Feel",
-                    description="Build on the swung rhythm with syncopation and rhythmic displacement",
-                    musical_reasoning="Swung rhythms can be enhanced with additional syncopation and off-beat accents",
-                    implementation_notes="Try adding anticipations and delayed attacks to enhance the swing feel",
-                    confidence_score=0.8,
-                    suggestion_type="rhythm"
-                ))
-            elif "syncopated" in intent.concept.lower():
-                suggestions.append(MusicalSuggestion(
-                    suggestion_id=str(uuid.uuid4()),
-                    title="Develop Syncopation",
-                    description="Expand the syncopated patterns with polyrhythmic elements",
-                    musical_reasoning="Syncopated rhythms can be developed with more complex rhythmic patterns",
-                    implementation_notes="Try adding polyrhythmic elements or cross-rhythms",
-                    confidence_score=0.7,
-                    suggestion_type="rhythm"
-                ))
+    def _generate_all_suggestions(self, intents: List[MusicalIntent]) -> List[MusicalSuggestion]:
+        """Generate suggestions for all intents in one pass, grouped as rhythm, harmony, then melody"""
+        suggestions_by_type: Dict[str, List[MusicalSuggestion]] = {
+            intent_type: [] for intent_type in _SUGGESTION_RULES
+        }
         
-        return suggestions
-    
-    def _generate_harmonic_suggestions(self, intent_collection: IntentCollection) -> List[MusicalSuggestion]:
-        """Generate harmonic suggestions based on discovered intents"""
-        suggestions = []
-        
-        # Find harmonic intents
-        harmonic_intents = [intent for intent in intent_collection.intents if intent.intent_type == IntentType.HARMONIC]
-        
-        for intent in harmonic_intents:
-            if "jazz" in intent.concept.lower():
-                suggestions.append(MusicalSuggestion(
-                    suggestion_id=str(uuid.uuid4()),
-                    title="Expand Jazz Harmony",
-                    description="Add chord extensions and jazz harmony techniques",
-                    musical_reasoning="Jazz harmony can be expanded with extensions, alterations, and substitutions",
-                    implementation_notes="Try adding 9ths, 11ths, and 13ths to your chord progressions",
-                    confidence_score=0.8,
-                    suggestion_type="harmony"
-                ))
-            elif "seventh" in intent.concept.lower():
-                suggestions.append(MusicalSuggestion(
-                    suggestion_id=str(uuid.uuid4()),
-                    title="Develop Seventh Chords",
-                    description="Build on the seventh chord foundation with secondary dominants",
-                    musical_reasoning="Seventh chords can be developed with secondary dominants and extensions",
-                    implementation_notes="Try adding secondary dominants before your seventh chords",
-                    confidence_score=0.7,
-                    suggestion_type="harmony"
-                ))
+        for intent in intents:
+            keyword = _suggestion_keyword(intent.intent_type, intent.concept)
+            if keyword is not None:
+                template = _SUGGESTION_TEMPLATES[keyword]
+                suggestions_by_type[intent.intent_type].append(
+                    MusicalSuggestion(str(uuid.uuid4()), *template)
+                )
         
-        return suggestions
+        return [suggestion for group in suggestions_by_type.values() for suggestion in group]
     
-    def _generate_melodic_suggestions(self, intent_collection: IntentCollection) -> List[MusicalSuggestion]:
-        """Generate melodic suggestions based on discovered intents"""
-        suggestions = []
-        
-        # Find melodic intents
-        melodic_intents = [intent for intent in intent_collection.intents if intent.intent_type == IntentType.MELODIC]
-        
-        for intent in melodic_intents:
-            if "ascending" in intent.concept.lower():
-                suggestions.append(MusicalSuggestion(
-                    suggestion_id=str(uuid.uuid4()),
-                    title="Develop Ascending Melody",
-                    description="Build on the ascending melodic idea with sequences and development",
-                    musical_reasoning="Ascending melodies can be developed with sequences and motivic development",
-                    implementation_notes="Try creating melodic sequences that build on the ascending pattern",
-                    confidence_score=0.8,
-                    suggestion_type="melody"
-                ))
-            elif "sparse" in intent.concept.lower():
-                suggestions.append(MusicalSuggestion(
-                    suggestion_id=str(uuid.uuid4()),
-                    title="Add Melodic Detail",
-                    description="Enhance the sparse melody with ornamentation and passing tones",
-                    musical_reasoning="Sparse melodies can be enhanced with tasteful ornamentation",
-                    implementation_notes="Try adding passing tones, neighbor tones, and melodic ornaments",
-                    confidence_score=0.7,
-                    suggestion_type="melody"
-                ))
-        
-        return suggestions
+    def set_creative_enhancements(self, enhancements: List[Dict[str, Any]]) -> None:
+        """Replace the creative enhancements for the current conversation"""
+        self.conversation_context.creative_enhancements = enhancements
+        self.state_version += 1
     
     def generate_midi_prompt(self, length: str = "4-bar", focus: str = "all elements") -> str:
         """Generate a prompt for MIDI generation based on discovered intent"""
@@ -328,10 +373,19 @@ class EnhancedMusicalConversationEngine:
         
         # Generate creative enhancements if not already done
         if not self.conversation_context.creative_enhancements:
-            self.conversation_context.creative_enhancements = suggest_musical_enhancements(
+            self.set_creative_enhancements(suggest_musical_enhancements(
                 self.conversation_context.intent_collection, 
                 "medium"
-            )
+            ))
+        
+        # Prompts only change with the conversation state, so reuse them until it moves on
+        if self._prompt_cache_version != self.state_version:
+            self._prompt_cache.clear()
+            self._prompt_cache_version = self.state_version
+        
+        cache_key = (length, focus)
+        if cache_key in self._prompt_cache:
+            return self._prompt_cache[cache_key]
         
         # Generate the prompt
         prompt = generate_musical_prompt(
@@ -341,6 +395,7 @@ class EnhancedMusicalConversationEngine:
             focus
         )
         
+        self._prompt_cache[cache_key] = prompt
         return prompt
     
     def get_context_summary(self) -> str:
@@ -405,7 +460,8 @@ class EnhancedMusicalConversationEngine:
                 'session_id': self.conversation_context.session_id,
                 'discovery_complete': self.conversation_context.discovery_complete,
                 'conversation_history': self.conversation_context.conversation_history,
-                'suggestion_history': [s.__dict__ for s in self.suggestion_history]
+                # Dataclasses are serialized by the encoder, no intermediate dicts needed
+                'suggestion_history': self.suggestion_history
             }
             
             # Add intent collection if available
@@ -416,8 +472,12 @@ class EnhancedMusicalConversationEngine:
             if self.conversation_context.creative_enhancements:
                 conversation_data['creative_enhancements'] = self.conversation_context.creative_enhancements
             
-            with open(file_path, 'w') as f:
-                json.dump(conversation_data, f, indent=2)
+            if ORJSON_AVAILABLE:
+                with open(file_path, 'wb') as f:
+                    f.write(orjson.dumps(conversation_data, option=orjson.OPT_INDENT_2))
+            else:
+                with open(file_path, 'w') as f:
+                    json.dump(conversation_data, f, indent=2, default=_json_default)
             
             return True
         except Exception as e:
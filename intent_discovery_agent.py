@@ -6,8 +6,10 @@ musical intent through natural dialogue rather than rigid schema filling.
 """
 
 from typing import List, Dict, Any, Optional, Tuple
+from collections import Counter, defaultdict, deque
 from datetime import datetime
 import re
+import sys
 
 from schemas import MusicalContext, MusicalIntent, IntentType, IntentConfidence, IntentCollection
 from intent_parser import ConversationalIntentParser
@@ -17,6 +19,26 @@ from question_generator import (
 )
 
 
+# Common musical reference patterns, compiled once
+_EXAMPLE_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r"like\s+([^,\.]+)",  # "like Miles Davis"
+    r"similar\s+to\s+([^,\.]+)",  # "similar to that song"
+    r"in\s+the\s+style\s+of\s+([^,\.]+)",  # "in the style of John Coltrane"
+    r"reminds\s+me\s+of\s+([^,\.]+)",  # "reminds me of that one song"
+    r"think\s+([^,\.]+)",  # "think Herbie Hancock"
+))
+
+# Musical elements a discovery needs before it can be considered complete
+_ESSENTIAL_ELEMENTS = frozenset({IntentType.RHYTHMIC, IntentType.HARMONIC, IntentType.MELODIC})
+
+_WELCOME_MESSAGE = (
+    "🎵 Welcome to your musical discovery session! I'm here to help you explore "
+    "and clarify your musical vision. Think of me as your musical conversation partner - "
+    "I'll ask questions, listen to your ideas, and help you discover what you're "
+    "really trying to create. There are no wrong answers, just musical exploration!"
+)
+
+
 class MusicalIntentDiscoveryAgent:
     """
     A conversation-driven agent that discovers musical intent through natural dialogue,
@@ -28,8 +50,12 @@ class MusicalIntentDiscoveryAgent:
         self.question_flow = ConversationalQuestionFlow()
         self.current_context = initial_context or MusicalContext()
         self.discovered_intents: List[MusicalIntent] = []
+        # Kept in step with discovered_intents by _add_discovered_intents
+        self._intent_type_counts: Counter = Counter()
+        self._high_confidence_count = 0
         self.conversation_history: List[Dict[str, Any]] = []
-        self.musical_examples: Dict[str, List[str]] = {}
+        self._highlights: deque = deque(maxlen=5)  # Last substantial user inputs
+        self.musical_examples: Dict[str, List[str]] = defaultdict(list)
         self.discovery_complete = False
         
         # Initialize conversation
@@ -50,16 +76,17 @@ class MusicalIntentDiscoveryAgent:
         if user_initial_input:
             # Process the initial input
             intents, response = self.intent_parser.process_user_input(user_initial_input)
-            self.discovered_intents.extend(intents)
+            self._add_discovered_intents(intents)
             self.current_context = self.intent_parser.current_context
             
             # Record the interaction
             self.conversation_history.append({
                 "type": "user_input",
                 "content": user_initial_input,
-                "intents": [intent.dict() for intent in intents],
+                "intents": intents,
                 "timestamp": datetime.now()
             })
+            self._record_highlight(user_initial_input)
             
             # Generate follow-up question
             next_question = self.question_flow.get_next_question(self.current_context, intents)
@@ -93,24 +120,28 @@ class MusicalIntentDiscoveryAgent:
         Returns:
             Dictionary containing response, discovered intents, and next steps
         """
+        # One clock read covers every record made for this turn
+        now = datetime.now()
+        
         # Check for musical examples or references
         examples = self._extract_musical_examples(user_input)
         if examples:
-            self._record_musical_examples(examples)
+            self._record_musical_examples(examples, now)
         
         # Process intents from the input
         intents, response = self.intent_parser.process_user_input(user_input)
-        self.discovered_intents.extend(intents)
+        self._add_discovered_intents(intents)
         self.current_context = self.intent_parser.current_context
         
         # Record the interaction
         self.conversation_history.append({
             "type": "user_input",
             "content": user_input,
-            "intents": [intent.dict() for intent in intents],
+            "intents": intents,
             "examples": examples,
-            "timestamp": datetime.now()
+            "timestamp": now
         })
+        self._record_highlight(user_input)
         
         # Generate next question or discovery step
         next_question = self.question_flow.get_next_question(self.current_context, intents)
@@ -132,40 +163,36 @@ class MusicalIntentDiscoveryAgent:
             "examples_referenced": examples
         }
     
+    def _add_discovered_intents(self, intents: List[MusicalIntent]) -> None:
+        """Record newly discovered intents and update the per-type counts."""
+        self.discovered_intents.extend(intents)
+        self._intent_type_counts.update(intent.intent_type for intent in intents)
+        self._high_confidence_count += sum(
+            1 for intent in intents if intent.confidence == IntentConfidence.HIGH
+        )
+    
     def _generate_welcome_message(self) -> str:
         """Generate a welcoming message that sets the tone for musical discovery."""
-        return (
-            "🎵 Welcome to your musical discovery session! I'm here to help you explore "
-            "and clarify your musical vision. Think of me as your musical conversation partner - "
-            "I'll ask questions, listen to your ideas, and help you discover what you're "
-            "really trying to create. There are no wrong answers, just musical exploration!"
-        )
+        return _WELCOME_MESSAGE
     
     def _extract_musical_examples(self, text: str) -> List[str]:
         """Extract musical examples, references, or metaphors from user input."""
         examples = []
         
-        # Look for common musical reference patterns
-        patterns = [
-            r"like\s+([^,\.]+)",  # "like Miles Davis"
-            r"similar\s+to\s+([^,\.]+)",  # "similar to that song"
-            r"in\s+the\s+style\s+of\s+([^,\.]+)",  # "in the style of John Coltrane"
-            r"reminds\s+me\s+of\s+([^,\.]+)",  # "reminds me of that one song"
-            r"think\s+([^,\.]+)",  # "think Herbie Hancock"
-        ]
+        # Each pattern scans separately so overlapping references ("think like ...") are all kept
+        for pattern in _EXAMPLE_PATTERNS:
+            for match in pattern.findall(text):
+                example = match.strip()
+                if example:
+                    examples.append(example)
         
-        for pattern in patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            examples.extend(matches)
-        
-        return [example.strip() for example in examples if example.strip()]
+        return examples
     
-    def _record_musical_examples(self, examples: List[str]) -> None:
+    def _record_musical_examples(self, examples: List[str], now: Optional[datetime] = None) -> None:
         """Record musical examples for context building."""
+        timestamp = (now or datetime.now()).isoformat()
         for example in examples:
-            if example not in self.musical_examples:
-                self.musical_examples[example] = []
-            self.musical_examples[example].append(datetime.now().isoformat())
+            self.musical_examples[sys.intern(example)].append(timestamp)
     
     def _format_question(self, question: MusicalQuestion) -> Dict[str, Any]:
         """Format a question for presentation to the user."""
@@ -193,22 +220,16 @@ class MusicalIntentDiscoveryAgent:
     
     def _assess_discovery_completeness(self) -> bool:
         """Assess if the musical discovery is complete enough to proceed."""
-        # Check for essential musical elements
-        intent_types = {intent.intent_type for intent in self.discovered_intents}
-        essential_elements = {IntentType.RHYTHMIC, IntentType.HARMONIC, IntentType.MELODIC}
-        
-        has_essential = len(intent_types.intersection(essential_elements)) >= 2
+        # Check for sufficient detail first; it is the cheapest test
+        if len(self.discovered_intents) < 5:
+            return False
         
         # Check for context
-        has_context = (
-            self.current_context.tempo is not None and
-            self.current_context.target_instrument is not None
-        )
-        
-        # Check for sufficient detail
-        has_sufficient_detail = len(self.discovered_intents) >= 5
+        if self.current_context.tempo is None or self.current_context.target_instrument is None:
+            return False
         
-        return has_essential and has_context and has_sufficient_detail
+        # Check for essential musical elements
+        return len(self._intent_type_counts.keys() & _ESSENTIAL_ELEMENTS) >= 2
     
     def _generate_musical_insights(self) -> List[str]:
         """Generate insights about the discovered musical vision."""
@@ -218,7 +239,7 @@ class MusicalIntentDiscoveryAgent:
             return insights
         
         # Analyze intent types
-        intent_types = {intent.intent_type for intent in self.discovered_intents}
+        intent_types = self._intent_type_counts
         
         if IntentType.RHYTHMIC in intent_types:
             insights.append("You have a clear rhythmic vision")
@@ -233,8 +254,7 @@ class MusicalIntentDiscoveryAgent:
             insights.append("Emotional character is clear")
         
         # Analyze confidence levels
-        high_confidence = [intent for intent in self.discovered_intents if intent.confidence == IntentConfidence.HIGH]
-        if len(high_confidence) > len(self.discovered_intents) * 0.7:
+        if self._high_confidence_count > len(self.discovered_intents) * 0.7:
             insights.append("You have a strong, clear musical vision")
         
         # Analyze examples
@@ -292,9 +312,8 @@ class MusicalIntentDiscoveryAgent:
             score += 0.1
         
         # Musical elements (40% of score)
-        intent_types = {intent.intent_type for intent in self.discovered_intents}
-        essential_elements = {IntentType.RHYTHMIC, IntentType.HARMONIC, IntentType.MELODIC}
-        element_score = len(intent_types.intersection(essential_elements)) / len(essential_elements)
+        intent_types = self._intent_type_counts.keys()
+        element_score = len(intent_types & _ESSENTIAL_ELEMENTS) / len(_ESSENTIAL_ELEMENTS)
         score += element_score * 0.4
         
         # Detail level (20% of score)
@@ -303,17 +322,14 @@ class MusicalIntentDiscoveryAgent:
         
         return min(score, 1.0)
     
+    def _record_highlight(self, content: str) -> None:
+        """Keep a user input as a highlight if it is substantial."""
+        if len(content) > 20:  # Only include substantial inputs
+            self._highlights.append(content[:100] + "..." if len(content) > 100 else content)
+    
     def _get_conversation_highlights(self) -> List[str]:
         """Get highlights from the conversation history."""
-        highlights = []
-        
-        for entry in self.conversation_history:
-            if entry["type"] == "user_input":
-                content = entry["content"]
-                if len(content) > 20:  # Only include substantial inputs
-                    highlights.append(content[:100] + "..." if len(content) > 100 else content)
-        
-        return highlights[-5:]  # Return last 5 highlights
+        return list(self._highlights)  # Last 5 highlights
     
     def export_for_generation(self) -> Dict[str, Any]:
         """Export the discovered musical intent for MIDI generation."""
@@ -326,8 +342,7 @@ class MusicalIntentDiscoveryAgent:
             context=self.current_context
         )
         
-        for intent in self.discovered_intents:
-            collection.add_intent(intent)
+        collection.add_intents(self.discovered_intents)
         
         return {
             "intent_collection": collection.dict(),
@@ -10,6 +10,7 @@ from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
 import re
 import json
+from collections import Counter
 
 from schemas import (
     MusicalIntent, IntentCollection, MusicalContext, IntentType, 
@@ -17,6 +18,12 @@ from schemas import (
 )
 
 
+# Patterns used when folding extracted intents back into the context
+_TEMPO_PATTERN = re.compile(r'(\d+)')
+_KEY_SIGNATURE_PATTERN = re.compile(r'([A-G][#b]?\s*(?:major|minor))', re.IGNORECASE)
+_GENRES = frozenset({'jazz', 'rock', 'funk', 'blues', 'classical'})
+
+
 class ConversationalIntentParser:
     """
     Advanced conversational parser that understands musical context
@@ -27,12 +34,19 @@ class ConversationalIntentParser:
         self.conversation_history: List[Dict[str, Any]] = []
         self.current_context: Optional[MusicalContext] = None
         self.intent_relationships: Dict[str, List[str]] = {}
+        # History entries already folded into _collected_intents
+        self._collection_cursor = 0
+        self._collected_intents: List[MusicalIntent] = []
+        # Built once; its context is pointed at current_context each turn
+        self._intent_parser = IntentParser(self.current_context)
         
     def start_conversation(self, initial_context: Optional[MusicalContext] = None) -> str:
         """Start a new musical conversation session."""
         self.conversation_history = []
         self.current_context = initial_context or MusicalContext()
         self.intent_relationships = {}
+        self._collection_cursor = 0
+        self._collected_intents = []
         
         session_id = f"conv_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
         
@@ -52,16 +66,19 @@ class ConversationalIntentParser:
         Returns:
             Tuple of (extracted_intents, response_suggestion)
         """
+        # One clock read covers both history entries for this turn
+        now = datetime.now()
+        
         # Add user input to conversation history
         self.conversation_history.append({
             "type": "user_input",
-            "timestamp": datetime.now(),
+            "timestamp": now,
             "content": user_input
         })
         
         # Parse intents from the input
-        parser = IntentParser(self.current_context)
-        intents = parser.parse_intent(user_input, "conversation")
+        self._intent_parser.context = self.current_context
+        intents = self._intent_parser.parse_intent(user_input, "conversation")
         
         # Update context based on new intents
         self._update_context_from_intents(intents)
@@ -72,9 +89,9 @@ class ConversationalIntentParser:
         # Add response to history
         self.conversation_history.append({
             "type": "system_response",
-            "timestamp": datetime.now(),
+            "timestamp": now,
             "content": response,
-            "intents_extracted": [intent.dict() for intent in intents]
+            "intents_extracted": intents  # Serialized on export, not every turn
         })
         
         return intents, response
@@ -82,24 +99,26 @@ class ConversationalIntentParser:
     def _update_context_from_intents(self, intents: List[MusicalIntent]) -> None:
         """Update the current context based on extracted intents."""
         for intent in intents:
+            concept_lower = intent.concept.lower()
+            
             # Update context based on intent type
             if intent.intent_type == IntentType.RHYTHMIC:
-                if "tempo" in intent.concept.lower():
-                    tempo_match = re.search(r'(\d+)', intent.concept)
+                if "tempo" in concept_lower:
+                    tempo_match = _TEMPO_PATTERN.search(intent.concept)
                     if tempo_match:
                         self.current_context.tempo = int(tempo_match.group(1))
-                elif "feel" in intent.concept.lower() or "groove" in intent.concept.lower():
+                elif "feel" in concept_lower or "groove" in concept_lower:
                     self.current_context.mood = intent.concept
             
             elif intent.intent_type == IntentType.HARMONIC:
-                if "key" in intent.concept.lower():
+                if "key" in concept_lower:
                     # Extract key signature
-                    key_match = re.search(r'([A-G][#b]?\s*(?:major|minor))', intent.concept, re.IGNORECASE)
+                    key_match = _KEY_SIGNATURE_PATTERN.search(intent.concept)
                     if key_match:
                         self.current_context.key_signature = key_match.group(1)
             
             elif intent.intent_type == IntentType.STYLISTIC:
-                if any(genre in intent.concept.lower() for genre in ['jazz', 'rock', 'funk', 'blues', 'classical']):
+                if any(genre in concept_lower for genre in _GENRES):
                     self.current_context.genre = intent.concept
             
             elif intent.intent_type == IntentType.EMOTIONAL:
@@ -180,28 +199,31 @@ class ConversationalIntentParser:
     
     def get_current_intent_collection(self) -> IntentCollection:
         """Get the current collection of all intents from this conversation."""
-        all_intents = []
-        
-        for entry in self.conversation_history:
+        # Only scan history appended since the previous call
+        for entry in self.conversation_history[self._collection_cursor:]:
             if entry["type"] == "system_response" and "intents_extracted" in entry:
-                for intent_data in entry["intents_extracted"]:
-                    intent = MusicalIntent(**intent_data)
-                    all_intents.append(intent)
+                self._collected_intents.extend(entry["intents_extracted"])
+        self._collection_cursor = len(self.conversation_history)
         
         collection = IntentCollection(
             generation_id=f"conv_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
             context=self.current_context
         )
         
-        for intent in all_intents:
-            collection.add_intent(intent)
+        collection.add_intents(self._collected_intents)
         
         return collection
     
     def export_conversation(self) -> Dict[str, Any]:
         """Export the complete conversation for analysis or storage."""
+        history = [
+            {**entry, "intents_extracted": [intent.dict() for intent in entry["intents_extracted"]]}
+            if "intents_extracted" in entry else entry
+            for entry in self.conversation_history
+        ]
+        
         return {
-            "conversation_history": self.conversation_history,
+            "conversation_history": history,
             "current_context": self.current_context.dict() if self.current_context else None,
             "intent_relationships": self.intent_relationships,
             "exported_at": datetime.now().isoformat()
@@ -216,47 +238,53 @@ class IntentAnalyzer:
     @staticmethod
     def analyze_intent_collection(collection: IntentCollection) -> Dict[str, Any]:
         """Analyze an intent collection and provide insights."""
+        type_counts = Counter(intent.intent_type for intent in collection.intents)
+        confidence_counts = Counter(intent.confidence for intent in collection.intents)
+        
         analysis = {
             "total_intents": len(collection.intents),
-            "intent_types": {},
-            "confidence_distribution": {},
+            "intent_types": dict(type_counts),
+            "confidence_distribution": dict(confidence_counts),
             "temporal_analysis": {},
             "relationship_analysis": {},
             "suggestions": []
         }
         
-        # Count intents by type
-        for intent in collection.intents:
-            intent_type = intent.intent_type
-            if intent_type not in analysis["intent_types"]:
-                analysis["intent_types"][intent_type] = 0
-            analysis["intent_types"][intent_type] += 1
-        
-        # Count confidence levels
-        for intent in collection.intents:
-            confidence = intent.confidence
-            if confidence not in analysis["confidence_distribution"]:
-                analysis["confidence_distribution"][confidence] = 0
-            analysis["confidence_distribution"][confidence] += 1
-        
-        # Analyze relationships
+        # Analyze relationships; the first concept wins ties, as with max()
+        most_connected = None
+        most_connections = -1
+        for concept, related in collection.intent_graph.items():
+            if len(related) > most_connections:
+                most_connected = (concept, related)
+                most_connections = len(related)
+        
         analysis["relationship_analysis"] = {
             "total_relationships": len(collection.intent_graph),
-            "most_connected": max(collection.intent_graph.items(), key=lambda x: len(x[1])) if collection.intent_graph else None
+            "most_connected": most_connected
         }
         
         # Generate suggestions
-        analysis["suggestions"] = IntentAnalyzer._generate_suggestions(collection)
+        analysis["suggestions"] = IntentAnalyzer._generate_suggestions(
+            collection, type_counts, confidence_counts
+        )
         
         return analysis
     
     @staticmethod
-    def _generate_suggestions(collection: IntentCollection) -> List[str]:
+    def _generate_suggestions(
+        collection: IntentCollection,
+        type_counts: Optional[Counter] = None,
+        confidence_counts: Optional[Counter] = None
+    ) -> List[str]:
         """Generate suggestions based on the intent collection."""
         suggestions = []
+        if type_counts is None:
+            type_counts = Counter(intent.intent_type for intent in collection.intents)
+        if confidence_counts is None:
+            confidence_counts = Counter(intent.confidence for intent in collection.intents)
         
         # Check for missing elements
-        intent_types = {intent.intent_type for intent in collection.intents}
+        intent_types = type_counts.keys()
         
         if IntentType.RHYTHMIC not in intent_types:
             suggestions.append("Consider adding rhythmic elements to define the groove")
@@ -268,9 +296,9 @@ class IntentAnalyzer:
             suggestions.append("Melodic ideas would add character and memorability")
         
         # Check for low confidence intents
-        low_confidence_intents = [intent for intent in collection.intents if intent.confidence == IntentConfidence.LOW]
-        if low_confidence_intents:
-            suggestions.append(f"Clarify {len(low_confidence_intents)} musical concepts for better results")
+        low_confidence_count = confidence_counts[IntentConfidence.LOW]
+        if low_confidence_count:
+            suggestions.append(f"Clarify {low_confidence_count} musical concepts for better results")
         
         # Check for isolated intents
         if len(collection.intent_graph) < len(collection.intents) * 0.5:
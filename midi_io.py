@@ -11,11 +11,22 @@ to avoid the "Black Box Dependency Problem" and maintain velocity.
 
 from __future__ import annotations
 
+import io
 import mido
 from typing import List, Dict, Any, Optional
 from pathlib import Path
 
 
+def _load_midi_file(filepath: Path) -> mido.MidiFile:
+    """Load a MIDI file from a single bulk read.
+    
+    mido decodes files one byte at a time through ``read(1)``/``tell()``.
+    Reading the whole file up front and parsing from an in-memory buffer
+    keeps those calls off the real file object.
+    """
+    return mido.MidiFile(file=io.BytesIO(filepath.read_bytes()))
+
+
 def parse_midi_file(filepath: str) -> List[Dict[str, Any]]:
     """
     Parse a MIDI file into a simple, universal list of dictionaries.
@@ -44,7 +55,7 @@ def parse_midi_file(filepath: str) -> List[Dict[str, Any]]:
         raise FileNotFoundError(f"MIDI file not found: {filepath}")
     
     try:
-        midi_file = mido.MidiFile(str(filepath))
+        midi_file = _load_midi_file(filepath)
     except Exception as e:
         raise ValueError(f"Failed to parse MIDI file {filepath}: {e}")
     
@@ -58,7 +69,7 @@ def parse_midi_file(filepath: str) -> List[Dict[str, Any]]:
     # Process each track
     for track_index, track in enumerate(midi_file.tracks):
         current_time_ticks = 0
-        active_notes = {}  # Track note-on events waiting for note-off
+        active_notes = {}  # (channel, note) -> (velocity, start_time_seconds) awaiting note-off
         
         for message in track:
             # Update current time in ticks
@@ -77,29 +88,24 @@ def parse_midi_file(filepath: str) -> List[Dict[str, Any]]:
             
             # Handle note-on events
             elif message.type == 'note_on' and message.velocity > 0:
-                note_key = (message.channel, message.note)
-                active_notes[note_key] = {
-                    'pitch': message.note,
-                    'velocity': message.velocity,
-                    'start_time_seconds': current_time_seconds,
-                    'track_index': track_index
-                }
+                # A plain tuple is enough here; the note dict is only built once the note ends
+                active_notes[(message.channel, message.note)] = (message.velocity, current_time_seconds)
             
             # Handle note-off events
             elif message.type == 'note_off' or (message.type == 'note_on' and message.velocity == 0):
                 note_key = (message.channel, message.note)
                 if note_key in active_notes:
-                    note_data = active_notes.pop(note_key)
-                    duration_seconds = current_time_seconds - note_data['start_time_seconds']
+                    velocity, start_time_seconds = active_notes.pop(note_key)
+                    duration_seconds = current_time_seconds - start_time_seconds
                     
                     # Only include notes with positive duration
                     if duration_seconds > 0:
                         notes_data.append({
-                            'pitch': note_data['pitch'],
-                            'velocity': note_data['velocity'],
-                            'start_time_seconds': note_data['start_time_seconds'],
+                            'pitch': message.note,
+                            'velocity': velocity,
+                            'start_time_seconds': start_time_seconds,
                             'duration_seconds': duration_seconds,
-                            'track_index': note_data['track_index']
+                            'track_index': track_index
                         })
     
     # Sort notes by start time for chronological order
@@ -207,9 +213,11 @@ def save_midi_file(notes_data: List[Dict[str, Any]], filepath: str, ticks_per_be
         
         midi_file.tracks.append(track)
     
-    # Save the file
+    # Serialize in memory and write the file in one call
     try:
-        midi_file.save(str(filepath))
+        buffer = io.BytesIO()
+        midi_file.save(file=buffer)
+        Path(filepath).write_bytes(buffer.getvalue())
     except Exception as e:
         raise OSError(f"Failed to save MIDI file {filepath}: {e}")
 
@@ -265,7 +273,7 @@ def get_file_info(filepath: str) -> Dict[str, Any]:
         }
     """
     try:
-        midi_file = mido.MidiFile(str(filepath))
+        midi_file = _load_midi_file(Path(filepath))
         
         # Count notes and find duration
         num_notes = 0
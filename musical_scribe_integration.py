@@ -5,14 +5,12 @@ Integration layer that bridges the Musical Scribe architecture with the existing
 Provides seamless integration while maintaining fallback to existing functionality.
 """
 
-import os
 import logging
-from typing import Dict, List, Any, Optional
+from typing import Dict, Any, Optional
 from pathlib import Path
 
-from musical_scribe import MusicalScribeEngine, MusicalScribeResult
-from musical_scribe.project_state_parser import ProjectState
-from musical_scribe.musical_context_engine import MusicalContext
+from musical_scribe import MusicalScribeEngine
+from musical_scribe.musical_scribe_engine import MusicalScribeResult
 
 
 class MusicalScribeIntegration:
@@ -55,13 +53,13 @@ class MusicalScribeIntegration:
             Dict containing enhancement results and metadata
         """
         try:
-            self.logger.info(f"Starting Musical Scribe enhancement for: {project_path}")
+            self.logger.info("Starting Musical Scribe enhancement for: %s", project_path)
             
             # Run Musical Scribe enhancement
             result = self.engine.enhance_music(project_path, user_request)
             
             if result.success:
-                self.logger.info(f"Musical Scribe enhancement successful: {len(result.patterns)} patterns generated")
+                self.logger.info("Musical Scribe enhancement successful: %d patterns generated", len(result.patterns))
                 
                 # Export debug information if enabled
                 if self.export_debug_info:
@@ -72,7 +70,7 @@ class MusicalScribeIntegration:
                 
                 return integration_result
             else:
-                self.logger.error(f"Musical Scribe enhancement failed: {result.error_message}")
+                self.logger.error("Musical Scribe enhancement failed: %s", result.error_message)
                 
                 if self.fallback_enabled:
                     self.logger.info("Falling back to existing system...")
@@ -86,7 +84,7 @@ class MusicalScribeIntegration:
                     }
                     
         except Exception as e:
-            self.logger.error(f"Musical Scribe integration error: {str(e)}")
+            self.logger.error("Musical Scribe integration error: %s", e)
             
             if self.fallback_enabled:
                 self.logger.info("Falling back to existing system due to error...")
@@ -164,7 +162,7 @@ class MusicalScribeIntegration:
             return analysis
             
         except Exception as e:
-            self.logger.error(f"Project analysis failed: {str(e)}")
+            self.logger.error("Project analysis failed: %s", e)
             return {
                 'success': False,
                 'error': str(e),
@@ -211,7 +209,7 @@ class MusicalScribeIntegration:
             }
             
         except Exception as e:
-            self.logger.error(f"Contextual prompt generation failed: {str(e)}")
+            self.logger.error("Contextual prompt generation failed: %s", e)
             return {
                 'success': False,
                 'error': str(e),
@@ -285,7 +283,7 @@ class MusicalScribeIntegration:
             }
             
         except Exception as e:
-            self.logger.error(f"Fallback enhancement failed: {str(e)}")
+            self.logger.error("Fallback enhancement failed: %s", e)
             return {
                 'success': False,
                 'error': f"Both Musical Scribe and fallback failed: {str(e)}",
@@ -325,10 +323,10 @@ class MusicalScribeIntegration:
             with open(debug_file, 'w') as f:
                 json.dump(debug_info, f, indent=2)
             
-            self.logger.info(f"Debug information exported to: {debug_file}")
+            self.logger.info("Debug information exported to: %s", debug_file)
             
         except Exception as e:
-            self.logger.warning(f"Failed to export debug information: {str(e)}")
+            self.logger.warning("Failed to export debug information: %s", e)
     
     def get_system_status(self) -> Dict[str, Any]:
         """Get Musical Scribe system status."""
@@ -344,18 +342,18 @@ class MusicalScribeIntegration:
     def enable_fallback(self, enabled: bool = True) -> None:
         """Enable or disable fallback to existing system."""
         self.fallback_enabled = enabled
-        self.logger.info(f"Fallback {'enabled' if enabled else 'disabled'}")
+        self.logger.info("Fallback %s", "enabled" if enabled else "disabled")
     
     def enable_debug_export(self, enabled: bool = True) -> None:
         """Enable or disable debug information export."""
         self.export_debug_info = enabled
         if enabled:
             self.debug_output_dir.mkdir(exist_ok=True)
-        self.logger.info(f"Debug export {'enabled' if enabled else 'disabled'}")
+        self.logger.info("Debug export %s", "enabled" if enabled else "disabled")
     
     def set_debug_output_dir(self, output_dir: str) -> None:
         """Set debug output directory."""
         self.debug_output_dir = Path(output_dir)
         if self.export_debug_info:
             self.debug_output_dir.mkdir(exist_ok=True)
-        self.logger.info(f"Debug output directory set to: {self.debug_output_dir}")
+        self.logger.info("Debug output directory set to: %s", self.debug_output_dir)
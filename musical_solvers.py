@@ -20,9 +20,12 @@ from __future__ import annotations
 
 import time
 import random
+from operator import itemgetter
 from typing import Dict, List, Optional, Tuple, Any
 from dataclasses import dataclass
 
+import numpy as np
+
 from analysis import apply_swing, filter_notes_by_pitch
 from midi_io import parse_midi_file, save_midi_file
 from project import Project
@@ -33,19 +36,42 @@ def _fix_midi_timing(notes: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     if not notes:
         return notes
     
-    # Ensure all times are non-negative
-    fixed_notes = []
-    for note in notes:
-        new_note = note.copy()
-        new_note['start_time_seconds'] = max(0.0, note['start_time_seconds'])
-        fixed_notes.append(new_note)
+    # Ensure all times are non-negative (one copy per note, built in a single pass)
+    fixed_notes = [
+        {**note, 'start_time_seconds': max(0.0, note['start_time_seconds'])}
+        for note in notes
+    ]
     
     # Sort by start time
-    fixed_notes.sort(key=lambda n: n['start_time_seconds'])
+    fixed_notes.sort(key=itemgetter('start_time_seconds'))
     
     return fixed_notes
 
 
+# Pitch-class templates used by HarmonyFixer._identify_chord, in match order.
+# Built once at import instead of re-testing membership chains per segment.
+# Add more chord types as needed.
+_CHORD_TEMPLATES: Tuple[Tuple[frozenset, str], ...] = (
+    (frozenset({0, 4, 7}), "C major"),
+    (frozenset({2, 6, 9}), "D minor"),
+    (frozenset({4, 8, 11}), "E minor"),
+)
+
+
+def _notes_to_arrays(notes: List[Dict[str, Any]]) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Convert note dicts into parallel (pitch, velocity, start, duration) arrays.
+    
+    Analysis passes work on these columns instead of re-walking the dicts
+    for every metric.
+    """
+    count = len(notes)
+    pitches = np.fromiter((note['pitch'] for note in notes), dtype=np.int64, count=count)
+    velocities = np.fromiter((note.get('velocity', 64) for note in notes), dtype=np.float64, count=count)
+    start_times = np.fromiter((note['start_time_seconds'] for note in notes), dtype=np.float64, count=count)
+    durations = np.fromiter((note.get('duration_seconds', 0.0) for note in notes), dtype=np.float64, count=count)
+    return pitches, velocities, start_times, durations
+
+
 @dataclass
 class MusicalSolution:
     """Represents a musical solution with explanation and audio preview."""
@@ -72,15 +98,42 @@ class GrooveImprover:
             MusicalSolution with improved notes and explanation
         """
         try:
-            # Load and analyze the project
+            # Load the project
             project = Project()
             project.load_from_midi(midi_file_path)
             notes = project.get_all_notes()
+        except Exception as e:
+            return MusicalSolution(
+                improved_notes=[],
+                explanation=f"Error analyzing groove: {str(e)}",
+                changes_made=[],
+                confidence=0.0
+            )
+        
+        if not notes:
+            return MusicalSolution(
+                improved_notes=[],
+                explanation="No notes found in the MIDI file.",
+                changes_made=[],
+                confidence=0.0
+            )
+        
+        return self.improve_groove_from_notes(notes)
+    
+    def improve_groove_from_notes(self, notes: List[Dict[str, Any]]) -> MusicalSolution:
+        """Analyze and improve the groove of notes that are already in memory.
+        
+        Args:
+            notes: Note dictionaries in the project/midi_io format
             
+        Returns:
+            MusicalSolution with improved notes and explanation
+        """
+        try:
             if not notes:
                 return MusicalSolution(
                     improved_notes=[],
-                    explanation="No notes found in the MIDI file.",
+                    explanation="No notes to analyze.",
                     changes_made=[],
                     confidence=0.0
                 )
@@ -120,17 +173,20 @@ class GrooveImprover:
         if not notes:
             return {"swing": 0.5, "syncopation": 0.0, "timing_consistency": 0.0, "velocity_variation": 0.0}
         
+        # Build the note columns once and share them across all metrics
+        _, velocities, start_times, _ = _notes_to_arrays(notes)
+        
         # Calculate swing ratio
-        swing_ratio = self._calculate_swing_ratio(notes)
+        swing_ratio = self._calculate_swing_ratio(start_times)
         
         # Calculate syncopation
-        syncopation = self._calculate_syncopation(notes)
+        syncopation = self._calculate_syncopation(start_times)
         
         # Calculate timing consistency
-        timing_consistency = self._calculate_timing_consistency(notes)
+        timing_consistency = self._calculate_timing_consistency(start_times)
         
         # Calculate velocity variation
-        velocity_variation = self._calculate_velocity_variation(notes)
+        velocity_variation = self._calculate_velocity_variation(velocities)
         
         return {
             "swing": swing_ratio,
@@ -139,93 +195,64 @@ class GrooveImprover:
             "velocity_variation": velocity_variation
         }
     
-    def _calculate_swing_ratio(self, notes: List[Dict[str, Any]]) -> float:
+    def _calculate_swing_ratio(self, start_times: np.ndarray) -> float:
         """Calculate the current swing ratio."""
-        if not notes:
+        if start_times.size == 0:
             return 0.5
         
         # Analyze timing patterns to detect swing
-        off_beat_notes = 0
-        total_notes = len(notes)
-        
-        for note in notes:
-            start_time = note['start_time_seconds']
-            beat_position = start_time % 0.5  # Assuming 120 BPM
-            if 0.4 <= beat_position <= 0.6:  # Off-beat position
-                off_beat_notes += 1
+        beat_positions = np.mod(start_times, 0.5)  # Assuming 120 BPM
+        off_beat_notes = int(np.count_nonzero((beat_positions >= 0.4) & (beat_positions <= 0.6)))
         
-        if total_notes == 0:
-            return 0.5
-            
         # Calculate swing ratio based on off-beat note timing
-        swing_ratio = 0.5 + (off_beat_notes / total_notes) * 0.3
-        return min(1.0, max(0.0, swing_ratio))
+        swing_ratio = 0.5 + (off_beat_notes / start_times.size) * 0.3
+        return min(1.0, max(0.0, float(swing_ratio)))
     
-    def _calculate_syncopation(self, notes: List[Dict[str, Any]]) -> float:
+    def _calculate_syncopation(self, start_times: np.ndarray) -> float:
         """Calculate the syncopation level."""
-        if not notes:
+        if start_times.size == 0:
             return 0.0
-            
-        syncopated_notes = 0
-        total_notes = len(notes)
         
-        for note in notes:
-            start_time = note['start_time_seconds']
-            beat_position = start_time % 1.0  # Assuming 120 BPM
-            # Check for notes on weak beats
-            if 0.25 <= beat_position <= 0.35 or 0.75 <= beat_position <= 0.85:
-                syncopated_notes += 1
+        # Check for notes on weak beats
+        beat_positions = np.mod(start_times, 1.0)  # Assuming 120 BPM
+        syncopated = ((beat_positions >= 0.25) & (beat_positions <= 0.35)) | \
+                     ((beat_positions >= 0.75) & (beat_positions <= 0.85))
         
-        return syncopated_notes / total_notes if total_notes > 0 else 0.0
+        return int(np.count_nonzero(syncopated)) / start_times.size
     
-    def _calculate_timing_consistency(self, notes: List[Dict[str, Any]]) -> float:
+    def _calculate_timing_consistency(self, start_times: np.ndarray) -> float:
         """Calculate how consistent the timing is."""
-        if len(notes) < 2:
+        if start_times.size < 2:
             return 1.0
         
         # Calculate variance in note intervals
-        intervals = []
-        sorted_notes = sorted(notes, key=lambda n: n['start_time_seconds'])
-        
-        for i in range(1, len(sorted_notes)):
-            interval = sorted_notes[i]['start_time_seconds'] - sorted_notes[i-1]['start_time_seconds']
-            if 0.1 <= interval <= 2.0:  # Reasonable note spacing
-                intervals.append(interval)
+        intervals = np.diff(np.sort(start_times))
+        intervals = intervals[(intervals >= 0.1) & (intervals <= 2.0)]  # Reasonable note spacing
         
-        if not intervals:
+        if intervals.size == 0:
             return 1.0
         
         # Calculate coefficient of variation (lower is more consistent)
-        mean_interval = sum(intervals) / len(intervals)
-        variance = sum((x - mean_interval) ** 2 for x in intervals) / len(intervals)
-        std_dev = variance ** 0.5
-        
+        mean_interval = intervals.mean()
         if mean_interval == 0:
             return 1.0
         
-        cv = std_dev / mean_interval
+        cv = intervals.std() / mean_interval
         # Convert to 0-1 scale where 1 is most consistent
-        consistency = max(0.0, 1.0 - cv)
+        consistency = max(0.0, 1.0 - float(cv))
         return min(1.0, consistency)
     
-    def _calculate_velocity_variation(self, notes: List[Dict[str, Any]]) -> float:
+    def _calculate_velocity_variation(self, velocities: np.ndarray) -> float:
         """Calculate the velocity variation."""
-        if not notes:
+        if velocities.size == 0:
             return 0.0
         
-        velocities = [note.get('velocity', 64) for note in notes]
-        if not velocities:
-            return 0.0
-        
-        mean_velocity = sum(velocities) / len(velocities)
-        variance = sum((v - mean_velocity) ** 2 for v in velocities) / len(velocities)
-        std_dev = variance ** 0.5
-        
+        mean_velocity = velocities.mean()
         if mean_velocity == 0:
             return 0.0
         
         # Return coefficient of variation as variation measure
-        return std_dev / mean_velocity
+        return float(velocities.std() / mean_velocity)
     
     def _apply_groove_improvements(self, notes: List[Dict[str, Any]], analysis: Dict[str, Any]) -> Tuple[List[Dict[str, Any]], List[str]]:
         """Apply groove improvements based on analysis."""
@@ -256,31 +283,19 @@ class GrooveImprover:
     
     def _add_timing_humanization(self, notes: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Add subtle timing humanization."""
-        humanized_notes = []
-        
-        for note in notes:
-            new_note = note.copy()
-            # Add ±5ms random variation, but ensure non-negative time
-            timing_variation = (random.random() - 0.5) * 0.01  # ±5ms
-            new_start_time = max(0.0, note['start_time_seconds'] + timing_variation)
-            new_note['start_time_seconds'] = new_start_time
-            humanized_notes.append(new_note)
-        
-        return humanized_notes
+        # Add ±5ms random variation, but ensure non-negative time
+        return [
+            {**note, 'start_time_seconds': max(0.0, note['start_time_seconds'] + (random.random() - 0.5) * 0.01)}
+            for note in notes
+        ]
     
     def _add_velocity_variation(self, notes: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Add velocity variation for dynamic interest."""
-        varied_notes = []
-        
-        for note in notes:
-            new_note = note.copy()
-            # Add ±10 velocity units variation
-            velocity_variation = random.randint(-10, 10)
-            new_velocity = max(1, min(127, note.get('velocity', 64) + velocity_variation))
-            new_note['velocity'] = new_velocity
-            varied_notes.append(new_note)
-        
-        return varied_notes
+        # Add ±10 velocity units variation
+        return [
+            {**note, 'velocity': max(1, min(127, note.get('velocity', 64) + random.randint(-10, 10)))}
+            for note in notes
+        ]
     
     def _add_syncopation(self, notes: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Add syncopation by shifting some notes to off-beats."""
@@ -341,15 +356,42 @@ class HarmonyFixer:
             MusicalSolution with improved harmony and explanation
         """
         try:
-            # Load and analyze the project
+            # Load the project
             project = Project()
             project.load_from_midi(midi_file_path)
             notes = project.get_all_notes()
+        except Exception as e:
+            return MusicalSolution(
+                improved_notes=[],
+                explanation=f"Error analyzing harmony: {str(e)}",
+                changes_made=[],
+                confidence=0.0
+            )
+        
+        if not notes:
+            return MusicalSolution(
+                improved_notes=[],
+                explanation="No notes found in the MIDI file.",
+                changes_made=[],
+                confidence=0.0
+            )
+        
+        return self.fix_harmony_from_notes(notes)
+    
+    def fix_harmony_from_notes(self, notes: List[Dict[str, Any]]) -> MusicalSolution:
+        """Analyze and fix harmonic issues in notes that are already in memory.
+        
+        Args:
+            notes: Note dictionaries in the project/midi_io format
             
+        Returns:
+            MusicalSolution with improved harmony and explanation
+        """
+        try:
             if not notes:
                 return MusicalSolution(
                     improved_notes=[],
-                    explanation="No notes found in the MIDI file.",
+                    explanation="No notes to analyze.",
                     changes_made=[],
                     confidence=0.0
                 )
@@ -389,17 +431,20 @@ class HarmonyFixer:
         if not notes:
             return {"chord_progression": [], "voice_leading": 0.0, "harmonic_rhythm": 0.0, "dissonance": 0.0}
         
+        # Group notes into time segments once and share them across the analyses
+        time_segments = self._group_notes_by_segment(notes)
+        
         # Analyze chord progression
-        chord_progression = self._analyze_chord_progression(notes)
+        chord_progression = self._analyze_chord_progression(time_segments)
         
         # Analyze voice leading
         voice_leading = self._analyze_voice_leading(notes)
         
-        # Analyze harmonic rhythm
-        harmonic_rhythm = self._analyze_harmonic_rhythm(notes)
+        # Analyze harmonic rhythm (reuses the chords identified above)
+        harmonic_rhythm = self._analyze_harmonic_rhythm(chord_progression, len(time_segments))
         
         # Analyze dissonance
-        dissonance = self._analyze_dissonance(notes)
+        dissonance = self._analyze_dissonance(time_segments)
         
         return {
             "chord_progression": chord_progression,
@@ -408,18 +453,17 @@ class HarmonyFixer:
             "dissonance": dissonance
         }
     
-    def _analyze_chord_progression(self, notes: List[Dict[str, Any]]) -> List[str]:
-        """Analyze the chord progression."""
-        # Simplified chord analysis
-        # Group notes by time segments
+    def _group_notes_by_segment(self, notes: List[Dict[str, Any]]) -> Dict[int, List[Dict[str, Any]]]:
+        """Group notes by quarter-note time segments, in order of first appearance."""
         time_segments = {}
         for note in notes:
-            start_time = note['start_time_seconds']
-            segment = int(start_time * 4)  # Quarter note segments
-            if segment not in time_segments:
-                time_segments[segment] = []
-            time_segments[segment].append(note)
-        
+            segment = int(note['start_time_seconds'] * 4)  # Quarter note segments
+            time_segments.setdefault(segment, []).append(note)
+        return time_segments
+    
+    def _analyze_chord_progression(self, time_segments: Dict[int, List[Dict[str, Any]]]) -> List[str]:
+        """Analyze the chord progression."""
+        # Simplified chord analysis
         # Identify chords in each segment
         chords = []
         for segment_notes in time_segments.values():
@@ -436,20 +480,13 @@ class HarmonyFixer:
             return None
         
         # Get pitch classes
-        pitch_classes = set()
-        for note in notes:
-            pitch_classes.add(note['pitch'] % 12)
+        pitch_classes = {note['pitch'] % 12 for note in notes}
         
-        # Simple chord identification
+        # Simple chord identification against the precomputed templates
         if len(pitch_classes) >= 3:
-            # Check for major triad
-            if 0 in pitch_classes and 4 in pitch_classes and 7 in pitch_classes:
-                return "C major"
-            elif 2 in pitch_classes and 6 in pitch_classes and 9 in pitch_classes:
-                return "D minor"
-            elif 4 in pitch_classes and 8 in pitch_classes and 11 in pitch_classes:
-                return "E minor"
-            # Add more chord types as needed
+            for template, chord_name in _CHORD_TEMPLATES:
+                if template <= pitch_classes:
+                    return chord_name
         
         return "Unknown chord"
     
@@ -511,56 +548,38 @@ class HarmonyFixer:
         
         return voices
     
-    def _analyze_harmonic_rhythm(self, notes: List[Dict[str, Any]]) -> float:
+    def _analyze_harmonic_rhythm(self, chord_progression: List[str], segment_count: int) -> float:
         """Analyze harmonic rhythm (how often chords change)."""
-        if not notes:
+        if segment_count == 0:
             return 0.0
         
         # Count chord changes per measure
         chord_changes = 0
         last_chord = None
         
-        time_segments = {}
-        for note in notes:
-            start_time = note['start_time_seconds']
-            segment = int(start_time * 4)  # Quarter note segments
-            if segment not in time_segments:
-                time_segments[segment] = []
-            time_segments[segment].append(note)
-        
-        for segment_notes in time_segments.values():
-            if len(segment_notes) >= 2:
-                chord = self._identify_chord(segment_notes)
-                if chord and chord != last_chord:
-                    chord_changes += 1
-                    last_chord = chord
+        for chord in chord_progression:
+            if chord != last_chord:
+                chord_changes += 1
+                last_chord = chord
         
         # Good harmonic rhythm has moderate chord changes
         # Too many changes = unstable, too few = boring
-        optimal_changes = len(time_segments) // 2
+        optimal_changes = segment_count // 2
         if optimal_changes == 0:
             return 0.5
         
         rhythm_quality = 1.0 - abs(chord_changes - optimal_changes) / optimal_changes
         return max(0.0, min(1.0, rhythm_quality))
     
-    def _analyze_dissonance(self, notes: List[Dict[str, Any]]) -> float:
+    def _analyze_dissonance(self, time_segments: Dict[int, List[Dict[str, Any]]]) -> float:
         """Analyze dissonance level."""
-        if not notes:
+        if not time_segments:
             return 0.0
         
         # Count dissonant intervals
         dissonant_intervals = 0
         total_intervals = 0
         
-        time_segments = {}
-        for note in notes:
-            start_time = note['start_time_seconds']
-            segment = int(start_time * 4)  # Quarter note segments
-            if segment not in time_segments:
-                time_segments[segment] = []
-            time_segments[segment].append(note)
-        
         for segment_notes in time_segments.values():
             if len(segment_notes) >= 2:
                 # Check all pairs of notes in the segment
@@ -656,15 +675,42 @@ class ArrangementImprover:
             MusicalSolution with improved arrangement and explanation
         """
         try:
-            # Load and analyze the project
+            # Load the project
             project = Project()
             project.load_from_midi(midi_file_path)
             notes = project.get_all_notes()
+        except Exception as e:
+            return MusicalSolution(
+                improved_notes=[],
+                explanation=f"Error analyzing arrangement: {str(e)}",
+                changes_made=[],
+                confidence=0.0
+            )
+        
+        if not notes:
+            return MusicalSolution(
+                improved_notes=[],
+                explanation="No notes found in the MIDI file.",
+                changes_made=[],
+                confidence=0.0
+            )
+        
+        return self.improve_arrangement_from_notes(notes)
+    
+    def improve_arrangement_from_notes(self, notes: List[Dict[str, Any]]) -> MusicalSolution:
+        """Analyze and improve the arrangement of notes that are already in memory.
+        
+        Args:
+            notes: Note dictionaries in the project/midi_io format
             
+        Returns:
+            MusicalSolution with improved arrangement and explanation
+        """
+        try:
             if not notes:
                 return MusicalSolution(
                     improved_notes=[],
-                    explanation="No notes found in the MIDI file.",
+                    explanation="No notes to analyze.",
                     changes_made=[],
                     confidence=0.0
                 )
@@ -704,17 +750,23 @@ class ArrangementImprover:
         if not notes:
             return {"structure": "none", "variation": 0.0, "density": 0.0, "dynamics": 0.0}
         
+        # Build the note columns once and share them across all metrics
+        pitches, velocities, start_times, durations = _notes_to_arrays(notes)
+        
+        # Structure and density both depend on the overall length; compute it once
+        total_duration = float((start_times + durations).max())
+        
         # Analyze song structure
-        structure = self._analyze_song_structure(notes)
+        structure = self._analyze_song_structure(total_duration)
         
         # Analyze variation
-        variation = self._analyze_variation(notes)
+        variation = self._analyze_variation(pitches, start_times)
         
         # Analyze density
-        density = self._analyze_density(notes)
+        density = self._analyze_density(start_times.size, total_duration)
         
         # Analyze dynamics
-        dynamics = self._analyze_dynamics(notes)
+        dynamics = self._analyze_dynamics(velocities)
         
         return {
             "structure": structure,
@@ -723,14 +775,9 @@ class ArrangementImprover:
             "dynamics": dynamics
         }
     
-    def _analyze_song_structure(self, notes: List[Dict[str, Any]]) -> str:
+    def _analyze_song_structure(self, total_duration: float) -> str:
         """Analyze the song structure."""
-        if not notes:
-            return "none"
-        
-        # Simple structure analysis based on note density over time
-        total_duration = max(note['start_time_seconds'] + note['duration_seconds'] for note in notes)
-        
+        # Simple structure analysis based on the overall length
         if total_duration < 30:
             return "short"
         elif total_duration < 120:
@@ -738,46 +785,36 @@ class ArrangementImprover:
         else:
             return "long"
     
-    def _analyze_variation(self, notes: List[Dict[str, Any]]) -> float:
+    def _analyze_variation(self, pitches: np.ndarray, start_times: np.ndarray) -> float:
         """Analyze variation in the arrangement."""
-        if len(notes) < 4:
+        if pitches.size < 4:
             return 0.0
         
         # Analyze pitch variation
-        pitches = [note['pitch'] for note in notes]
-        pitch_range = max(pitches) - min(pitches)
+        pitch_range = int(np.ptp(pitches))
         
         # Analyze rhythm variation
-        start_times = [note['start_time_seconds'] for note in notes]
-        intervals = [start_times[i+1] - start_times[i] for i in range(len(start_times)-1)]
-        rhythm_variation = len(set(intervals)) / len(intervals) if intervals else 0.0
+        intervals = np.diff(start_times)
+        rhythm_variation = np.unique(intervals).size / intervals.size if intervals.size else 0.0
         
         # Combine measures
         variation = (pitch_range / 60.0 + rhythm_variation) / 2.0
         return min(1.0, variation)
     
-    def _analyze_density(self, notes: List[Dict[str, Any]]) -> float:
+    def _analyze_density(self, note_count: int, total_duration: float) -> float:
         """Analyze note density."""
-        if not notes:
+        if note_count == 0 or total_duration == 0:
             return 0.0
         
-        total_duration = max(note['start_time_seconds'] + note['duration_seconds'] for note in notes)
-        if total_duration == 0:
-            return 0.0
-        
-        density = len(notes) / total_duration
+        density = note_count / total_duration
         return min(1.0, density / 4.0)  # Normalize to 0-1
     
-    def _analyze_dynamics(self, notes: List[Dict[str, Any]]) -> float:
+    def _analyze_dynamics(self, velocities: np.ndarray) -> float:
         """Analyze dynamic variation."""
-        if not notes:
-            return 0.0
-        
-        velocities = [note.get('velocity', 64) for note in notes]
-        if not velocities:
+        if velocities.size == 0:
             return 0.0
         
-        velocity_range = max(velocities) - min(velocities)
+        velocity_range = float(np.ptp(velocities))
         return min(1.0, velocity_range / 63.0)  # Normalize to 0-1
     
     def _apply_arrangement_improvements(self, notes: List[Dict[str, Any]], analysis: Dict[str, Any]) -> Tuple[List[Dict[str, Any]], List[str]]:
@@ -828,52 +865,32 @@ class ArrangementImprover:
     
     def _increase_density(self, notes: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Increase note density."""
-        # Add some passing tones
-        dense_notes = notes.copy()
-        
-        for i in range(len(notes) - 1):
-            if i % 2 == 0:  # Every other gap
-                current_note = notes[i]
-                next_note = notes[i + 1]
-                
-                # Add a passing tone between them
-                passing_tone = {
-                    'pitch': (current_note['pitch'] + next_note['pitch']) // 2,
-                    'velocity': current_note.get('velocity', 64),
-                    'start_time_seconds': current_note['start_time_seconds'] + 0.1,
-                    'duration_seconds': 0.2,
-                    'track_index': current_note.get('track_index', 0)
-                }
-                dense_notes.append(passing_tone)
-        
-        return dense_notes
+        # Add a passing tone in every other gap between consecutive notes
+        passing_tones = [
+            {
+                'pitch': (current_note['pitch'] + next_note['pitch']) // 2,
+                'velocity': current_note.get('velocity', 64),
+                'start_time_seconds': current_note['start_time_seconds'] + 0.1,
+                'duration_seconds': 0.2,
+                'track_index': current_note.get('track_index', 0)
+            }
+            for current_note, next_note in zip(notes[:-1:2], notes[1::2])
+        ]
+        
+        return notes + passing_tones
     
     def _decrease_density(self, notes: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Decrease note density by removing some notes."""
-        # Remove every 4th note
-        sparse_notes = []
-        for i, note in enumerate(notes):
-            if i % 4 != 0:  # Keep 3 out of 4 notes
-                sparse_notes.append(note)
-        
-        return sparse_notes
+        # Remove every 4th note (keep 3 out of 4)
+        return [note for i, note in enumerate(notes) if i % 4 != 0]
     
     def _add_dynamic_variation(self, notes: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Add dynamic variation."""
-        dynamic_notes = []
-        
-        for i, note in enumerate(notes):
-            new_note = note.copy()
-            
-            # Create a crescendo effect
-            base_velocity = note.get('velocity', 64)
-            dynamic_boost = (i % 8) * 5  # Build up over 8 notes
-            new_velocity = min(127, base_velocity + dynamic_boost)
-            new_note['velocity'] = new_velocity
-            
-            dynamic_notes.append(new_note)
-        
-        return dynamic_notes
+        # Create a crescendo effect, building up over 8 notes
+        return [
+            {**note, 'velocity': min(127, note.get('velocity', 64) + (i % 8) * 5)}
+            for i, note in enumerate(notes)
+        ]
     
     def _generate_arrangement_explanation(self, analysis: Dict[str, Any], changes_made: List[str]) -> str:
         """Generate a musical explanation of the arrangement improvements."""
@@ -7,9 +7,10 @@ constrained by rigid schemas.
 """
 
 from pydantic import BaseModel, Field
-from typing import Dict, List, Optional, Any, Union
+from typing import Dict, List, Optional, Any, Tuple, Union
 from datetime import datetime
 from enum import Enum
+from functools import lru_cache
 
 
 class IntentType(str, Enum):
@@ -125,14 +126,21 @@ class IntentCollection(BaseModel):
     
     def add_intent(self, intent: MusicalIntent) -> None:
         """Add a new intent to the collection."""
-        self.intents.append(intent)
+        self.add_intents([intent])
+    
+    def add_intents(self, intents: List[MusicalIntent]) -> None:
+        """Add several intents at once, updating the timestamp a single time."""
+        if not intents:
+            return
+        self.intents.extend(intents)
         self.updated_at = datetime.now()
         
         # Update relationships
-        for related_intent in intent.relationships:
-            if related_intent not in self.intent_graph:
-                self.intent_graph[related_intent] = []
-            self.intent_graph[related_intent].append(intent.concept)
+        for intent in intents:
+            for related_intent in intent.relationships:
+                if related_intent not in self.intent_graph:
+                    self.intent_graph[related_intent] = []
+                self.intent_graph[related_intent].append(intent.concept)
     
     def get_intents_by_type(self, intent_type: IntentType) -> List[MusicalIntent]:
         """Get all intents of a specific type."""
@@ -165,6 +173,13 @@ class IntentCollection(BaseModel):
         return " | ".join(context_parts)
 
 
+@lru_cache(maxsize=1024)
+def _tokenize(text: str) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """Split text into words and their lowercase forms, cached per input string."""
+    words = tuple(text.split())
+    return words, tuple(word.lower() for word in words)
+
+
 class IntentParser:
     """
     Parses natural language musical descriptions into structured intents.
@@ -264,11 +279,11 @@ class IntentParser:
     def _extract_concept(self, text: str, pattern: str) -> Optional[str]:
         """Extract the musical concept around a pattern."""
         # Simple extraction - in a real implementation, this would be more sophisticated
-        words = text.split()
+        words, lowered_words = _tokenize(text)
         pattern_words = pattern.split()
         
-        for i, word in enumerate(words):
-            if any(pw in word.lower() for pw in pattern_words):
+        for i, word in enumerate(lowered_words):
+            if any(pw in word for pw in pattern_words):
                 # Extract surrounding context
                 start = max(0, i - 2)
                 end = min(len(words), i + 3)
@@ -312,7 +327,6 @@ def parse_musical_description(text: str, context: MusicalContext, source: str =
     intents = parser.parse_intent(text, source)
     
     collection = create_intent_collection(f"gen_{datetime.now().strftime('%Y%m%d_%H%M%S')}", context)
-    for intent in intents:
-        collection.add_intent(intent)
+    collection.add_intents(intents)
     
     return collection
@@ -9,7 +9,7 @@ import time
 import json
 import asyncio
 import threading
-from typing import Dict, List, Optional, Any, Union, Callable
+from typing import Dict, List, Optional, Any, Union, Callable, Tuple
 from dataclasses import dataclass
 from enum import Enum
 import logging
@@ -26,6 +26,9 @@ from secure_llm_client import SecureLLMClient, LLMConfig, LLMRequest, LLMRespons
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# How long an OSC availability probe result is reused before probing again
+OSC_PROBE_CACHE_SECONDS = 30.0
+
 class EnhancementMode(Enum):
     """Enhancement system modes"""
     OFFLINE = "offline"
@@ -74,6 +77,7 @@ class FailFastEnhancer:
         self.health_checker = HealthChecker()
         self.safety_monitor = None
         self.logger = logging.getLogger("fail_fast_enhancer")
+        self._osc_probe: Optional[Tuple[float, bool]] = None  # (monotonic time, available)
         
         # Initialize component managers
         self.osc_manager = SecureOSCManager()
@@ -134,7 +138,17 @@ class FailFastEnhancer:
             return EnhancementMode.DEMO
     
     def _can_use_osc(self) -> bool:
-        """Check if OSC mode is available"""
+        """Check if OSC mode is available, reusing a recent probe result"""
+        now = time.monotonic()
+        if self._osc_probe is not None and now - self._osc_probe[0] < OSC_PROBE_CACHE_SECONDS:
+            return self._osc_probe[1]
+        
+        available = self._probe_osc()
+        self._osc_probe = (now, available)
+        return available
+    
+    def _probe_osc(self) -> bool:
+        """Send a test message to see whether OSC is reachable"""
         try:
             # Try to create OSC client
             config = OSCConfig(host="127.0.0.1", port=3819)
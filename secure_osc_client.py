@@ -22,7 +22,7 @@ from security_first_architecture import (
 )
 
 try:
-    from pythonosc import osc_client, osc_server, dispatcher
+    from pythonosc import osc_client, osc_server, dispatcher, osc_bundle_builder
     from pythonosc.osc_message_builder import OscMessageBuilder
     from pythonosc.udp_client import SimpleUDPClient
     OSC_AVAILABLE = True
@@ -82,8 +82,8 @@ class RateLimiter:
         self.last_update = time.time()
         self.lock = threading.Lock()
         
-    def is_allowed(self) -> bool:
-        """Check if request is allowed under rate limit"""
+    def is_allowed(self, count: int = 1) -> bool:
+        """Check if count requests are allowed under rate limit, taking all or no tokens"""
         with self.lock:
             now = time.time()
             time_passed = now - self.last_update
@@ -92,8 +92,8 @@ class RateLimiter:
             self.tokens = min(self.burst_size, self.tokens + time_passed * self.rate_per_second)
             self.last_update = now
             
-            if self.tokens >= 1:
-                self.tokens -= 1
+            if self.tokens >= count:
+                self.tokens -= count
                 return True
             return False
 
@@ -267,6 +267,23 @@ class SecureOSCClient(SecurityFirstComponent):
     
     def _validate_input(self, data: Any, context: SecurityContext) -> SecurityResult:
         """Validate OSC message input"""
+        if isinstance(data, list) and data:
+            # A bundle takes one rate-limit token per message, all at once
+            if len(data) > self.rate_limiter.burst_size:
+                return SecurityResult(
+                    success=False,
+                    message=f"Bundle of {len(data)} messages exceeds the rate limit burst size of {self.rate_limiter.burst_size}",
+                    security_level=SecurityLevel.MEDIUM,
+                    processing_time_ms=0
+                )
+            
+            # Bundles are valid only if every message in them is
+            for message in data:
+                result = self._validate_input(message, context)
+                if not result.success:
+                    return result
+            return result
+        
         if not isinstance(data, OSCMessage):
             return SecurityResult(
                 success=False,
@@ -277,8 +294,11 @@ class SecureOSCClient(SecurityFirstComponent):
         
         return self.validator.validate_message(data)
     
-    def _process_secure(self, data: OSCMessage, context: SecurityContext) -> Dict[str, Any]:
-        """Process OSC message securely"""
+    def _process_secure(self, data: Any, context: SecurityContext) -> Any:
+        """Process OSC message (or list of messages sent as one bundle) securely"""
+        if isinstance(data, list):
+            return self._process_bundle(data, context)
+        
         # Rate limiting
         if not self.rate_limiter.is_allowed():
             raise RateLimitExceededError("Rate limit exceeded for OSC messages")
@@ -309,6 +329,54 @@ class SecureOSCClient(SecurityFirstComponent):
             "timestamp": encrypted_message.timestamp
         }
     
+    def _process_bundle(self, messages: List[OSCMessage], context: SecurityContext) -> List[Dict[str, Any]]:
+        """Send several messages in a single OSC bundle (one UDP packet)"""
+        # Rate limiting still applies per message; a rejected bundle spends no tokens
+        if not self.rate_limiter.is_allowed(len(messages)):
+            raise RateLimitExceededError("Rate limit exceeded for OSC messages")
+        
+        encrypted_messages = [self.encryptor.encrypt_message(message) for message in messages]
+        
+        # Send bundle
+        if self.client:
+            try:
+                if OSC_AVAILABLE:
+                    bundle = osc_bundle_builder.OscBundleBuilder(osc_bundle_builder.IMMEDIATELY)
+                    for message in encrypted_messages:
+                        builder = OscMessageBuilder(address=message.address)
+                        for arg in message.arguments:
+                            builder.add_arg(arg)
+                        bundle.add_content(builder.build())
+                    self.client.send(bundle.build())
+                else:
+                    for message in encrypted_messages:
+                        self.client.send_message(message.address, message.arguments)
+                self.logger.debug(f"Sent OSC bundle of {len(encrypted_messages)} messages")
+            except Exception as e:
+                self.logger.error(f"Failed to send OSC bundle: {str(e)}")
+                raise SecurityError(f"OSC send failed: {str(e)}", SecurityLevel.MEDIUM)
+        
+        # Record messages in history
+        now = time.time()
+        self.message_history.extend(
+            {"message": message.to_dict(), "timestamp": now, "context": context.request_id}
+            for message in encrypted_messages
+        )
+        
+        return [
+            {
+                "success": True,
+                "message_id": message.message_id,
+                "address": message.address,
+                "timestamp": message.timestamp
+            }
+            for message in encrypted_messages
+        ]
+    
+    def send_bundle(self, messages: List[OSCMessage], context: SecurityContext) -> List[Dict[str, Any]]:
+        """Validate and send several messages as one OSC bundle"""
+        return self.process(messages, context)
+    
     def start_server(self, port: int, message_handler: Callable[[OSCMessage], None]):
         """Start OSC server for receiving messages"""
         if not OSC_AVAILABLE:
@@ -76,13 +76,8 @@ class Sequencer:
             target_start = float(note["start_beat"])
             sleep_beats = target_start - current_beat
             if sleep_beats > 0:
-                # Sleep in small increments to allow for stop signal
-                sleep_seconds = sleep_beats * self.seconds_per_beat
-                sleep_increment = 0.01  # 10ms increments
-                while sleep_seconds > 0 and not self._stop_event.is_set():
-                    sleep_time = min(sleep_increment, sleep_seconds)
-                    time.sleep(sleep_time)
-                    sleep_seconds -= sleep_time
+                # Wait until the note is due; stop() wakes this immediately
+                self._stop_event.wait(sleep_beats * self.seconds_per_beat)
 
             if self._stop_event.is_set():
                 break
@@ -122,22 +117,19 @@ class Sequencer:
         # Sort notes by start position in beats
         sorted_notes = sorted(self.notes, key=lambda n: n["start_beat"])
 
-        current_beat = 0.0
+        playback_start = time.monotonic()
         for note in sorted_notes:
             # Check for stop signal
             if self._stop_event.is_set():
                 break
                 
+            # Wait until the note is due against the fixed start time, so
+            # scheduling overhead does not accumulate as drift; stop() wakes
+            # this immediately
             target_start = float(note["start_beat"])
-            sleep_beats = target_start - current_beat
-            if sleep_beats > 0:
-                # Sleep in small increments to allow for stop signal
-                sleep_seconds = sleep_beats * self.seconds_per_beat
-                sleep_increment = 0.01  # 10ms increments
-                while sleep_seconds > 0 and not self._stop_event.is_set():
-                    sleep_time = min(sleep_increment, sleep_seconds)
-                    time.sleep(sleep_time)
-                    sleep_seconds -= sleep_time
+            delay = playback_start + target_start * self.seconds_per_beat - time.monotonic()
+            if delay > 0:
+                self._stop_event.wait(delay)
 
             if self._stop_event.is_set():
                 break
@@ -152,9 +144,6 @@ class Sequencer:
             timer = threading.Timer(duration_seconds, self._note_off_callback, args=[pitch])
             timer.start()
             self._note_off_timers[pitch] = timer
-
-            # Move current time reference to this note's start beat
-            current_beat = target_start
     
     def _note_off_callback(self, pitch: int) -> None:
         """Callback for note-off timer.
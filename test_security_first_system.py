@@ -197,6 +197,15 @@ class TestSecureOSCClient(unittest.TestCase):
         time.sleep(0.6)  # Wait for token to be available
         self.assertTrue(rate_limiter.is_allowed())
     
+    def test_rate_limiter_multiple_tokens(self):
+        """Test that a multi-token request takes all tokens or none"""
+        rate_limiter = RateLimiter(rate_per_second=1, burst_size=2)
+        
+        # Too many tokens requested: rejected without spending any
+        self.assertFalse(rate_limiter.is_allowed(3))
+        self.assertTrue(rate_limiter.is_allowed(2))
+        self.assertFalse(rate_limiter.is_allowed())
+    
     def test_osc_encryptor(self):
         """Test OSC message encryption"""
         encryptor = OSCEncryptor("test_key")
@@ -219,6 +228,63 @@ class TestSecureOSCClient(unittest.TestCase):
         encrypted.arguments = [4, 5, 6]
         self.assertFalse(encryptor.verify_message(encrypted))
 
+    def test_osc_bundle_processing(self):
+        """Test sending several messages as one bundle"""
+        self.client.client = Mock()
+        messages = [
+            self.client.create_message("/ardour/transport/play", [1]),
+            self.client.create_message("/enhancement/swing", [0.6])
+        ]
+
+        results = self.client.send_bundle(messages, self.context)
+
+        self.assertEqual(len(results), 2)
+        self.assertTrue(all(result["success"] for result in results))
+        self.assertEqual(len(self.client.get_message_history()), 2)
+
+    def test_osc_bundle_rejects_invalid_message(self):
+        """Test that one invalid message rejects the whole bundle"""
+        self.client.client = Mock()
+        messages = [
+            self.client.create_message("/ardour/transport/play", [1]),
+            self.client.create_message("/system/shutdown", [1])
+        ]
+
+        with self.assertRaises(InputValidationError):
+            self.client.send_bundle(messages, self.context)
+        self.assertEqual(self.client.get_message_history(), [])
+
+    def test_osc_bundle_rejects_oversized_bundle(self):
+        """Test that a bundle larger than the burst size is rejected as invalid"""
+        self.client.client = Mock()
+        self.client.rate_limiter = RateLimiter(rate_per_second=1, burst_size=2)
+        messages = [
+            self.client.create_message("/enhancement/swing", [0.6])
+            for _ in range(3)
+        ]
+
+        with self.assertRaises(InputValidationError):
+            self.client.send_bundle(messages, self.context)
+        self.assertEqual(self.client.client.method_calls, [])
+        self.assertEqual(self.client.get_message_history(), [])
+
+    def test_osc_bundle_rate_limit_spends_no_tokens(self):
+        """Test that a bundle over the rate limit leaves the tokens for later sends"""
+        self.client.client = Mock()
+        self.client.rate_limiter = RateLimiter(rate_per_second=0, burst_size=2)
+        messages = [
+            self.client.create_message("/enhancement/swing", [0.6])
+            for _ in range(2)
+        ]
+        self.client.send_bundle(messages[:1], self.context)
+
+        # One token left: the two-message bundle is refused without spending it
+        with self.assertRaises(RateLimitExceededError):
+            self.client.send_bundle(messages, self.context)
+
+        results = self.client.send_bundle(messages[:1], self.context)
+        self.assertEqual(len(results), 1)
+
 class TestSecureFileParser(unittest.TestCase):
     """Test the secure file parser"""
     
@@ -430,6 +496,14 @@ class TestSecureEnhancementSystem(unittest.TestCase):
         self.assertIsInstance(mode, EnhancementMode)
         self.assertIn(mode, [EnhancementMode.OFFLINE, EnhancementMode.DEMO])
     
+    def test_osc_probe_is_cached(self):
+        """Test that the OSC availability probe is reused between calls"""
+        with patch.object(self.enhancer, '_probe_osc', return_value=False) as probe:
+            self.assertFalse(self.enhancer._can_use_osc())
+            self.assertFalse(self.enhancer._can_use_osc())
+        
+        probe.assert_called_once()
+    
     def test_enhancement_request_creation(self):
         """Test enhancement request creation"""
         self.assertEqual(self.request.user_request, "Create a funky bassline")
@@ -179,7 +179,20 @@ class TestAnalysis(unittest.TestCase):
         # Original notes should be unchanged
         for i, note in enumerate(original_notes):
             self.assertEqual(note['start_time_seconds'], self.sample_notes[i]['start_time_seconds'])
-    
+
+    def test_apply_swing_copies_only_delayed_notes(self):
+        """Test that only delayed notes are copied; on-beat notes are shared."""
+        notes = [
+            {'pitch': 60, 'velocity': 80, 'start_time_seconds': 0.0, 'duration_seconds': 0.25, 'track_index': 0},
+            {'pitch': 62, 'velocity': 80, 'start_time_seconds': 0.25, 'duration_seconds': 0.25, 'track_index': 0}
+        ]
+
+        swung_notes = apply_swing(notes, swing_ratio=0.6, beat_duration=0.5)
+
+        self.assertIs(swung_notes[0], notes[0])
+        self.assertIsNot(swung_notes[1], notes[1])
+        self.assertEqual(notes[1]['start_time_seconds'], 0.25)
+
     def test_apply_swing_extreme_swing(self):
         """Test applying swing with extreme swing ratio."""
         off_beat_notes = [
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Unit tests for saving conversations from enhanced_musical_conversation_engine.py.
+
+Tests that the orjson and standard-library JSON paths write the same data.
+"""
+
+import unittest
+import sys
+import os
+import json
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import enhanced_musical_conversation_engine as engine_module
+from enhanced_musical_conversation_engine import EnhancedMusicalConversationEngine, MusicalSuggestion
+
+
+class TestConversationSave(unittest.TestCase):
+    """Test cases for EnhancedMusicalConversationEngine.save_conversation."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.engine = EnhancedMusicalConversationEngine()
+        self.engine.start_conversation(initial_input="A jazz piece in G minor at 120 BPM")
+        for user_input in [
+            "Swung eighths for the rhythm",
+            "Jazz sevenths for the harmony",
+            "A sparse, ascending melody that builds tension"
+        ]:
+            self.engine.process_user_input(user_input)
+        self.engine.suggestion_history.append(
+            MusicalSuggestion("id", "Title", "Description", "Reasoning", "Notes", 0.5, "rhythmic")
+        )
+        self.tmp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """Clean up temporary files."""
+        for path in Path(self.tmp_dir).iterdir():
+            path.unlink()
+        os.rmdir(self.tmp_dir)
+
+    def _save(self, name):
+        """Save the conversation and load the written JSON back."""
+        path = os.path.join(self.tmp_dir, name)
+        self.assertTrue(self.engine.save_conversation(path))
+        with open(path) as f:
+            return json.load(f)
+
+    def test_save_conversation_json(self):
+        """Test saving through the standard-library JSON path."""
+        with patch.object(engine_module, "ORJSON_AVAILABLE", False):
+            data = self._save("json.json")
+
+        self.assertEqual(data["session_id"], self.engine.conversation_context.session_id)
+        self.assertIn("intent_collection", data)
+        self.assertEqual(data["suggestion_history"][0]["title"], "Title")
+
+    @unittest.skipUnless(engine_module.ORJSON_AVAILABLE, "orjson not installed")
+    def test_save_conversation_orjson_matches_json(self):
+        """Test that the orjson path writes the same data as the JSON path."""
+        with patch.object(engine_module, "ORJSON_AVAILABLE", False):
+            json_data = self._save("json.json")
+        orjson_data = self._save("orjson.json")
+
+        self.assertEqual(orjson_data, json_data)
+
+
+if __name__ == '__main__':
+    unittest.main()